@@ -13,6 +13,7 @@ sys.path.insert(0, str(project_root))
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
+from tests.utils.test_tools import compile_extractor
 
 logging.basicConfig(
     level=logging.INFO,
@@ -21,6 +22,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# key=value pairs in a rendered args_template, with JSON-ish values
+ARG_PAIR_PATTERN = re.compile(r'(\w+)=(?:"([^"]*)"|\{([^}]*)\}|\[([^\]]*)\]|([^,\s]*))')
+
 
 def get_raw_response(result):
     """Extract raw text response from the tool result"""
@@ -60,9 +64,7 @@ def format_args(args_template, context):
     # Handle complex JSON structures in args
     try:
         # Extract key-value pairs with proper JSON handling
-        pattern = r'(\w+)=(?:"([^"]*)"|\{([^}]*)\}|\[([^\]]*)\]|([^,\s]*))'
-
-        for match in re.finditer(pattern, args_str):
+        for match in ARG_PAIR_PATTERN.finditer(args_str):
             key = match.group(1)
             value = next((g for g in match.groups()[1:] if g is not None), "")
 
@@ -135,7 +137,9 @@ async def run_test_configs(session, configs, context, tools_log, available_tools
             # Extract values using regex extractors
             if "regex_extractors" in test_config:
                 for key, pattern in test_config["regex_extractors"].items():
-                    match = re.search(pattern, raw_response, re.DOTALL | re.IGNORECASE)
+                    if not isinstance(pattern, re.Pattern):
+                        pattern = compile_extractor(pattern)
+                    match = pattern.search(raw_response)
                     if match and match.groups():
                         context[key] = match.group(1).strip()
         except Exception as e:
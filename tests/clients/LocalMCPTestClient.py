@@ -1,4 +1,5 @@
 import os
+import asyncio
 import argparse
 import json
 from asyncio import StreamReader, StreamWriter
@@ -10,18 +11,23 @@ from mcp.types import AnyUrl, ListResourcesResult, ReadResourceResult
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Upper bound on Claude <-> tool round trips for a single query
+MAX_TOOL_TURNS = 10
+
 
 class LocalMCPTestClient:
-    def __init__(self):
+    def __init__(self, anthropic=None):
         # Initialize session and client objects
         self.session: Optional[ClientSession] = None
         self.exit_stack = AsyncExitStack()
-        self.anthropic = Anthropic()
+        self.anthropic = anthropic or AsyncAnthropic()
+        # Claude tool definitions of the server's tools, built once on connect
+        self.available_tools: List[Dict[str, Any]] = []
         self.stdio: Optional[StreamReader] = None
         self.write: Optional[StreamWriter] = None
 
@@ -57,6 +63,14 @@ class LocalMCPTestClient:
         # List available tools
         response = await self.session.list_tools()
         tools = response.tools
+        self.available_tools = [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "input_schema": tool.inputSchema,
+            }
+            for tool in tools
+        ]
         print("\nConnected to server with tools:", [tool.name for tool in tools])
 
     async def list_resources(self) -> ListResourcesResult:
@@ -87,73 +101,55 @@ class LocalMCPTestClient:
         """Process a query using Claude and available tools"""
         messages: List[Dict[str, Any]] = [{"role": "user", "content": query}]
 
-        response = await self.session.list_tools()
-        available_tools = [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "input_schema": tool.inputSchema,
-            }
-            for tool in response.tools
-        ]
-
-        # Initial Claude API call
-        response = self.anthropic.messages.create(
-            model="claude-3-5-sonnet-20241022",
-            max_tokens=1000,
-            messages=messages,
-            tools=available_tools,
-        )
-
-        # Process response and handle tool calls
+        # Call Claude until it stops asking for tools, so one query can chain
+        # several tools
         final_text = []
-
-        assistant_message_content = []
-        for content in response.content:
-            if content.type == "text":
-                final_text.append(content.text)
-                assistant_message_content.append(content)
-            elif content.type == "tool_use":
-                tool_name = content.name
-                tool_args = content.input
-
-                # Execute tool call
-                result = await self.session.call_tool(tool_name, tool_args)
-
+        texts: List[str] = []
+        # Text of the last turn's tool results, returned if Claude doesn't
+        # summarize them
+        fallback_text: List[str] = []
+        for _ in range(MAX_TOOL_TURNS):
+            response = await self.anthropic.messages.create(
+                model="claude-3-5-sonnet-20241022",
+                max_tokens=1000,
+                messages=messages,
+                tools=self.available_tools,
+            )
+
+            texts = [c.text for c in response.content if c.type == "text"]
+            tool_uses = [c for c in response.content if c.type == "tool_use"]
+            final_text.extend(texts)
+            if not tool_uses:
+                break
+
+            # Run the turn's tool calls one at a time, in the order Claude
+            # asked for them, since later calls can depend on earlier ones
+            # (e.g. create then delete)
+            tool_results = []
+            fallback_text = []
+            for content in tool_uses:
+                result = await self.session.call_tool(content.name, content.input)
                 print(f"Tool Call Result: {result}")
-                final_text.append(f"[Calling tool {tool_name} with args {tool_args}]")
-
-                assistant_message_content.append(content)
-                messages.append(
-                    {"role": "assistant", "content": assistant_message_content}
+                final_text.append(
+                    f"[Calling tool {content.name} with args {content.input}]"
                 )
-
-                tool_result_content: Dict[str, Any] = {
-                    "type": "tool_result",
-                    "tool_use_id": content.id,
-                    "content": result.content,
-                }
-
-                messages.append({"role": "user", "content": [tool_result_content]})
-
-                # Get next response from Claude
-                response = self.anthropic.messages.create(
-                    model="claude-3-5-sonnet-20241022",
-                    max_tokens=1000,
-                    messages=messages,
-                    tools=available_tools,
+                tool_results.append(
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": content.id,
+                        "content": result.content,
+                    }
                 )
+                fallback_text.extend(
+                    item.text for item in result.content if hasattr(item, "text")
+                )
+
+            messages.append({"role": "assistant", "content": response.content})
+            messages.append({"role": "user", "content": tool_results})
 
-                if (
-                    response.content
-                    and len(response.content) > 0
-                    and hasattr(response.content[0], "text")
-                ):
-                    final_text.append(response.content[0].text)
-                else:
-                    for content_item in result.content:
-                        if hasattr(content_item, "text"):
-                            final_text.append(content_item.text)
+        # Fall back to the raw tool output if Claude's last reply had no text
+        if not texts:
+            final_text.extend(fallback_text)
 
         return "\n".join(final_text)
 
@@ -233,7 +229,7 @@ class LocalMCPTestClient:
 
         messages = [{"role": "user", "content": evaluation_prompt}]
 
-        claude_response = self.anthropic.messages.create(
+        claude_response = await self.anthropic.messages.create(
             model="claude-3-5-sonnet-20241022", max_tokens=100, messages=messages
         )
 
@@ -275,7 +271,7 @@ class LocalMCPTestClient:
 
         messages = [{"role": "user", "content": extraction_prompt}]
 
-        claude_response = self.anthropic.messages.create(
+        claude_response = await self.anthropic.messages.create(
             model="claude-3-5-sonnet-20241022", max_tokens=300, messages=messages
         )
 
@@ -306,6 +302,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
-
     asyncio.run(main())
@@ -1,10 +1,11 @@
+import asyncio
 import argparse
 import traceback
 import json
 from typing import Optional, List, Dict, Any
 from contextlib import AsyncExitStack
 
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 from dotenv import load_dotenv
 
 from mcp import ClientSession
@@ -12,12 +13,17 @@ from mcp.client.sse import sse_client
 
 load_dotenv()
 
+# Upper bound on Claude <-> tool round trips for a single query
+MAX_TOOL_TURNS = 10
+
 
 class RemoteMCPTestClient:
-    def __init__(self):
+    def __init__(self, anthropic=None):
         self.session: Optional[ClientSession] = None
         self.exit_stack = AsyncExitStack()
-        self.anthropic = Anthropic()
+        self.anthropic = anthropic or AsyncAnthropic()
+        # Claude tool definitions of the server's tools, built once on connect
+        self.available_tools: List[Dict[str, Any]] = []
 
     async def connect_to_server(self, sse_endpoint: str):
         """Connect to a remote MCP server via SSE
@@ -42,6 +48,14 @@ class RemoteMCPTestClient:
         print("Listing tools...")
         response = await self.session.list_tools()
         tools = response.tools
+        self.available_tools = [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "input_schema": tool.inputSchema,
+            }
+            for tool in tools
+        ]
         print("\nConnected to server with tools:", [tool.name for tool in tools])
 
     async def list_resources(self) -> None:
@@ -76,77 +90,55 @@ class RemoteMCPTestClient:
         if self.session is None:
             raise ValueError("Session not initialized")
 
-        response = await self.session.list_tools()
-        available_tools = [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "input_schema": tool.inputSchema,
-            }
-            for tool in response.tools
-        ]
-
-        # Initial Claude API call
-        response = self.anthropic.messages.create(
-            model="claude-3-5-sonnet-20241022",
-            max_tokens=1000,
-            messages=messages,
-            tools=available_tools,
-        )
-
-        # Process response and handle tool calls
+        # Call Claude until it stops asking for tools, so one query can chain
+        # several tools
         final_text = []
-
-        assistant_message_content = []
-        for content in response.content:
-            if content.type == "text":
-                final_text.append(content.text)
-                assistant_message_content.append(content)
-            elif content.type == "tool_use":
-                tool_name = content.name
-                tool_args = content.input
-
-                # Execute tool call
-                result = await self.session.call_tool(tool_name, tool_args)
-                final_text.append(f"[Calling tool {tool_name} with args {tool_args}]")
-
+        texts: List[str] = []
+        # Text of the last turn's tool results, returned if Claude doesn't
+        # summarize them
+        fallback_text: List[str] = []
+        for _ in range(MAX_TOOL_TURNS):
+            response = await self.anthropic.messages.create(
+                model="claude-3-5-sonnet-20241022",
+                max_tokens=1000,
+                messages=messages,
+                tools=self.available_tools,
+            )
+
+            texts = [c.text for c in response.content if c.type == "text"]
+            tool_uses = [c for c in response.content if c.type == "tool_use"]
+            final_text.extend(texts)
+            if not tool_uses:
+                break
+
+            # Run the turn's tool calls one at a time, in the order Claude
+            # asked for them, since later calls can depend on earlier ones
+            # (e.g. create then delete)
+            tool_results = []
+            fallback_text = []
+            for content in tool_uses:
+                result = await self.session.call_tool(content.name, content.input)
                 print(f"Tool Call Result: {result}")
-
-                assistant_message_content.append(content)
-                messages.append(
-                    {"role": "assistant", "content": assistant_message_content}
+                final_text.append(
+                    f"[Calling tool {content.name} with args {content.input}]"
                 )
-                messages.append(
+                tool_results.append(
                     {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "tool_result",
-                                "tool_use_id": content.id,
-                                "content": result.content,
-                            }
-                        ],
+                        "type": "tool_result",
+                        "tool_use_id": content.id,
+                        "content": result.content,
                     }
                 )
-
-                # Get next response from Claude
-                response = self.anthropic.messages.create(
-                    model="claude-3-5-sonnet-20241022",
-                    max_tokens=1000,
-                    messages=messages,
-                    tools=available_tools,
+                fallback_text.extend(
+                    item.text for item in result.content if hasattr(item, "text")
                 )
 
-                if (
-                    response.content
-                    and len(response.content) > 0
-                    and hasattr(response.content[0], "text")
-                ):
-                    final_text.append(response.content[0].text)
-                else:
-                    for content_item in result.content:
-                        if hasattr(content_item, "text"):
-                            final_text.append(content_item.text)
+            messages.append({"role": "assistant", "content": response.content})
+            messages.append({"role": "user", "content": tool_results})
+
+        # Fall back to the raw tool output if Claude's last reply had no text
+        if not texts:
+            final_text.extend(fallback_text)
 
         return "\n".join(final_text)
 
@@ -226,7 +218,7 @@ class RemoteMCPTestClient:
 
         messages = [{"role": "user", "content": evaluation_prompt}]
 
-        claude_response = self.anthropic.messages.create(
+        claude_response = await self.anthropic.messages.create(
             model="claude-3-5-sonnet-20241022", max_tokens=100, messages=messages
         )
 
@@ -268,7 +260,7 @@ class RemoteMCPTestClient:
 
         messages = [{"role": "user", "content": extraction_prompt}]
 
-        claude_response = self.anthropic.messages.create(
+        claude_response = await self.anthropic.messages.create(
             model="claude-3-5-sonnet-20241022", max_tokens=300, messages=messages
         )
 
@@ -299,6 +291,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
-
     asyncio.run(main())
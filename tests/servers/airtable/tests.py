@@ -1,9 +1,10 @@
 import pytest
-import uuid
-import json
-import time
-import random
-from tests.utils.test_tools import get_test_id, run_tool_test, run_resources_test
+from tests.utils.test_tools import (
+    get_test_ids,
+    run_tool_test,
+    run_resources_test,
+    random_id_setup,
+)
 
 
 # Shared context dictionary at module level
@@ -18,7 +19,7 @@ TOOL_TESTS = [
         "expected_keywords": ["new_base_id"],
         "regex_extractors": {"new_base_id": r"new_base_id\s*:\s*(app\w+)"},
         "description": "create a new Airtable base and return new base id",
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "list_bases",
@@ -34,7 +35,7 @@ TOOL_TESTS = [
         "regex_extractors": {"new_table_id": r"new_table_id\s*:\s*(tbl\w+)"},
         "description": "create a new table in a base",
         "depends_on": ["new_base_id"],
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "list_tables",
@@ -59,7 +60,7 @@ TOOL_TESTS = [
         "regex_extractors": {"field_id": r"field_id\s*:\s*(fld\w+)"},
         "description": "add a new field to an existing table",
         "depends_on": ["new_base_id", "new_table_id"],
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "update_field",
@@ -68,7 +69,7 @@ TOOL_TESTS = [
         "regex_extractors": {"updated_field_id": r"updated_field_id\s*:\s*(fld\w+)"},
         "description": "update a field's metadata in a table and return field id",
         "depends_on": ["new_base_id", "new_table_id", "field_id"],
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "update_table",
@@ -77,7 +78,7 @@ TOOL_TESTS = [
         "regex_extractors": {"updated_table_id": r"updated_table_id\s*:\s*(tbl\w+)"},
         "description": "update an existing table's name and description and return table id",
         "depends_on": ["new_base_id", "new_table_id"],
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "create_records",
@@ -86,7 +87,7 @@ TOOL_TESTS = [
         "regex_extractors": {"batch_record_id": r"batch_record_id\s*:\s*(rec\w+)"},
         "description": "create multiple records in an Airtable table and extract first record ID",
         "depends_on": ["new_base_id", "new_table_id"],
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "read_records",
@@ -103,7 +104,7 @@ TOOL_TESTS = [
         "regex_extractors": {"updated_record_id": r"updated_record_id\s*:\s*(rec\w+)"},
         "description": "update existing records in an Airtable table and return updated_record_id",
         "depends_on": ["new_base_id", "new_table_id", "batch_record_id"],
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "get_record",
@@ -154,7 +155,10 @@ async def test_resources(client):
     return await run_resources_test(client)
 
 
-@pytest.mark.parametrize("test_config", TOOL_TESTS, ids=get_test_id)
+TOOL_TEST_IDS = get_test_ids(TOOL_TESTS)
+
+
+@pytest.mark.parametrize("test_config", TOOL_TESTS, ids=TOOL_TEST_IDS)
 @pytest.mark.asyncio
 async def test_airtable_tool(client, context, test_config):
     return await run_tool_test(client, context, test_config)
@@ -1,397 +1,539 @@
+import os
+import re
+import asyncio
+import functools
+import httpx
+import logging
 import pytest
+import pytest_asyncio
 from datetime import datetime, timedelta
 
-# Test data
-test_contact = {
-    "first_name": "Test",
-    "last_name": "User",
-    "organization_name": "Test Org",
-    "title": "Software Engineer",
-    "email": "test.user@testorg.com",
-}
-
-test_contact_updated = {
-    "first_name": "Test",
-    "last_name": "User Updated",
-    "organization_name": "Test Org Updated",
-    "title": "Senior Software Engineer",
-    "email": "test.user.updated@testorg.com",
-}
-
-test_account = {
-    "name": "Test Organization",
-    "domain": "testorg.com",
-    "phone": "+1234567890",
-    "raw_address": "123 Test St, Test City, TS 12345",
-}
-
-test_account_updated = {
-    "name": "Test Organization Updated",
-    "domain": "testorg-updated.com",
-    "phone": "+1987654321",
-    "raw_address": "456 Test Ave, Test City, TS 12345",
-}
-
-test_deal = {
-    "name": "Test Deal",
-    "amount": "10000",
-    "closed_date": (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d"),
-}
-
-test_deal_updated = {
-    "name": "Test Deal Updated",
-    "amount": "15000",
-    "closed_date": (datetime.now() + timedelta(days=45)).strftime("%Y-%m-%d"),
-}
-
-test_task = {
-    "priority": "high",
-    "due_at": (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%SZ"),
-    "type": "call",
-    "status": "scheduled",
-    "note": "Test task for integration testing",
-}
-
-# Global variables to store IDs
-contact_id = ""
-account_id = ""
-deal_id = ""
-
-
-@pytest.mark.asyncio
-async def test_list_contact_stages(client):
-    """Test listing available contact stages."""
-    response = await client.process_query(
-        "Use the list_contact_stages tool to get available contact stages."
+from src.auth.factory import create_auth_client
+from tests.utils.test_tools import contains_ci
+
+logger = logging.getLogger(__name__)
+
+APOLLO_API_URL = "https://api.apollo.io/api/v1"
+VERBOSE = bool(os.environ.get("VERBOSE_APOLLO_TESTS"))
+_ID_RE = re.compile(r"\bid:\s*([A-Za-z0-9_\-]+)", re.IGNORECASE)
+
+
+# (tool name, Apollo API path the tool reads, key of the items in its response)
+LOOKUP_TESTS = [
+    ("list_contact_stages", "/contact_stages", "contact_stages"),
+    ("list_account_stages", "/account_stages", "account_stages"),
+    ("list_deal_stages", "/opportunity_stages", "opportunity_stages"),
+    ("list_users", "/users/search", "users"),
+]
+
+# (tool name, prompt builder taking the test data and created IDs, success phrase)
+TOOL_TESTS = [
+    (
+        "search_contacts",
+        # Runs after test_update_contact, so search for the seeded contact's
+        # updated name rather than the one it was created with
+        lambda data, ids: (
+            f"Use the search_contacts tool to search for contacts with the following criteria: "
+            f"First Name: {data['contact_updated']['first_name']}, "
+            f"Last Name: {data['contact_updated']['last_name']}, "
+            f"Organization Name: {data['contact_updated']['organization_name']}. "
+            "If successful, start your response with 'Contacts found successfully'."
+        ),
+        "contacts found successfully",
+    ),
+    (
+        "search_accounts",
+        lambda data, ids: (
+            f"Use the search_accounts tool to search for accounts with the following criteria: "
+            f"Organization Name: {data['account']['name']}. "
+            "If successful, start your response with 'Accounts found successfully'."
+        ),
+        "accounts found successfully",
+    ),
+    (
+        "create_task",
+        lambda data, ids: (
+            f"Use the create_task tool to create a task with the following details: "
+            f"User ID: 1, "
+            f"Contact ID: [{ids['contact_id']}], "
+            f"Priority: {data['task']['priority']}, "
+            f"Due At: {data['task']['due_at']}, "
+            f"Type: {data['task']['type']}, "
+            f"Status: {data['task']['status']}, "
+            f"Note: {data['task']['note']}. "
+            "If successful, start your response with 'Task created successfully'"
+        ),
+        "task created successfully",
+    ),
+]
+
+
+@functools.lru_cache(maxsize=1)
+def _test_data():
+    """Build the Apollo test payloads once, anchored to a single timestamp."""
+    now = datetime.now()
+    return {
+        "contact": {
+            "first_name": "Test",
+            "last_name": "User",
+            "organization_name": "Test Org",
+            "title": "Software Engineer",
+            "email": "test.user@testorg.com",
+        },
+        "contact_updated": {
+            "first_name": "Test",
+            "last_name": "User Updated",
+            "organization_name": "Test Org Updated",
+            "title": "Senior Software Engineer",
+            "email": "test.user.updated@testorg.com",
+        },
+        "account": {
+            "name": "Test Organization",
+            "domain": "testorg.com",
+            "phone": "+1234567890",
+            "raw_address": "123 Test St, Test City, TS 12345",
+        },
+        "account_updated": {
+            "name": "Test Organization Updated",
+            "domain": "testorg-updated.com",
+            "phone": "+1987654321",
+            "raw_address": "456 Test Ave, Test City, TS 12345",
+        },
+        "deal": {
+            "name": "Test Deal",
+            "amount": "10000",
+            "closed_date": (now + timedelta(days=30)).strftime("%Y-%m-%d"),
+        },
+        "deal_updated": {
+            "name": "Test Deal Updated",
+            "amount": "15000",
+            "closed_date": (now + timedelta(days=45)).strftime("%Y-%m-%d"),
+        },
+        "task": {
+            "priority": "high",
+            "due_at": (now + timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "type": "call",
+            "status": "scheduled",
+            "note": "Test task for integration testing",
+        },
+    }
+
+
+@pytest.fixture(scope="session")
+def data():
+    """Test payloads shared by every Apollo test in the session"""
+    return _test_data()
+
+
+def _report_pass(tool_name):
+    if VERBOSE:
+        print(f"✅ {tool_name} passed.")
+
+
+def _extract_id(response):
+    """Return the first 'ID: <value>' found in a response."""
+    match = _ID_RE.search(response)
+    assert match, f"Error parsing ID from response: {response}"
+    return match.group(1)
+
+
+@pytest.fixture(scope="module")
+def apollo_api_key():
+    """Apollo API key of the local test user, looked up the same way as the server"""
+    credentials = create_auth_client().get_user_credentials("apollo", "local")
+    api_key = (
+        credentials.get("api_key") if isinstance(credentials, dict) else credentials
     )
+    if not api_key:
+        pytest.skip("Apollo API key not found. Please run authentication first.")
+    return api_key
 
-    assert response, "No response returned from list_contact_stages"
-    assert (
-        "contact stages" in response.lower()
-    ), f"Expected contact stages in response: {response}"
 
-    print(f"Response: {response}")
-    print("✅ list_contact_stages passed.")
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def apollo_http(apollo_api_key):
+    """HTTP client for calling the Apollo API directly, bypassing the LLM"""
+    async with httpx.AsyncClient(
+        base_url=APOLLO_API_URL,
+        headers={"Cache-Control": "no-cache", "x-api-key": apollo_api_key},
+        timeout=30,
+    ) as http:
+        yield http
 
 
-@pytest.mark.asyncio
-async def test_create_contact(client):
-    """Test creating a new contact."""
-    global contact_id
+async def _delete_contact(apollo_http, contact_id):
+    """Delete a test contact, warning if it is left behind in the account."""
+    response = await apollo_http.delete(f"/contacts/{contact_id}")
+    if response.is_error:
+        logger.warning(
+            "Failed to delete Apollo test contact %s: %s %s",
+            contact_id,
+            response.status_code,
+            response.text,
+        )
 
-    response = await client.process_query(
-        f"Use the create_contact tool to create a contact with the following details: "
-        f"First Name: {test_contact['first_name']}, "
-        f"Last Name: {test_contact['last_name']}, "
-        f"Organization Name: {test_contact['organization_name']}, "
-        f"Title: {test_contact['title']}, "
-        f"Email: {test_contact['email']}. "
-        "If successful, start your response with 'Contact created successfully' and return the contact ID."
-        "Please return the contact ID in the format 'ID: <contact_id>'"
-    )
 
-    assert (
-        "contact created successfully" in response.lower()
-    ), f"Expected success phrase not found in response: {response}"
-    assert response, "No response returned from create_contact"
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def seeded_contact(apollo_http, data):
+    """Create a contact through the Apollo API, yield its ID and delete it afterwards.
 
-    try:
-        contact_id = response.lower().split("id:")[1].strip()
-    except Exception as e:
-        assert (
-            False
-        ), f"Error parsing contact ID from response: {response} with error: {str(e)}"
+    Tests that only need an existing contact use this instead of going
+    through create_contact, so they don't depend on the LLM create path.
+    """
+    response = await apollo_http.post("/contacts", json=data["contact"])
+    response.raise_for_status()
+    contact_id = response.json()["contact"]["id"]
 
-    print(f"Response: {response}")
-    print("✅ create_contact passed.")
+    yield contact_id
 
+    await _delete_contact(apollo_http, contact_id)
 
-@pytest.mark.asyncio
-async def test_search_contacts(client):
-    """Test searching for contacts."""
+
+async def _create_account(client, data):
+    """Create an account through the create_account tool and return its ID."""
     response = await client.process_query(
-        f"Use the search_contacts tool to search for contacts with the following criteria: "
-        f"First Name: {test_contact['first_name']}, "
-        f"Last Name: {test_contact['last_name']}, "
-        f"Organization Name: {test_contact['organization_name']}. "
-        "If successful, start your response with 'Contacts found successfully'."
+        f"Use the create_account tool to create an account with the following details: "
+        f"Name: {data['account']['name']}, "
+        f"Domain: {data['account']['domain']}, "
+        f"Phone: {data['account']['phone']}, "
+        f"Raw Address: {data['account']['raw_address']}. "
+        "If successful, start your response with 'Account created successfully' and return the account ID."
+        "Please return the account ID in the format 'ID: <account_id>'"
     )
 
-    assert (
-        "contacts found successfully" in response.lower()
+    assert contains_ci(
+        response, "account created successfully"
     ), f"Expected success phrase not found in response: {response}"
-    assert response, "No response returned from search_contacts"
 
-    print(f"Response: {response}")
-    print("✅ search_contacts passed.")
+    logger.debug("Response: %s", response)
 
+    return _extract_id(response)
 
-@pytest.mark.asyncio
-async def test_update_contact(client):
-    """Test updating an existing contact."""
-    global contact_id
 
+async def _create_deal(client, data, account_id):
+    """Create a deal on the given account through the create_deal tool and return its ID."""
     response = await client.process_query(
-        f"Use the update_contact tool to update the contact with the following details: "
-        f"Contact ID: {contact_id}, "
-        f"First Name: {test_contact_updated['first_name']}, "
-        f"Last Name: {test_contact_updated['last_name']}, "
-        f"Organization Name: {test_contact_updated['organization_name']}, "
-        f"Title: {test_contact_updated['title']}, "
-        f"Email: {test_contact_updated['email']}. "
-        "If successful, start your response with 'Contact updated successfully'."
+        f"Use the create_deal tool to create a deal with the following details: "
+        f"Name: {data['deal']['name']}, "
+        f"Account ID: {account_id}, "
+        f"Amount: {data['deal']['amount']}, "
+        f"Closed Date: {data['deal']['closed_date']}. "
+        "If successful, start your response with 'Deal created successfully' and return the deal ID."
+        "Please return the deal ID in the format 'ID: <deal_id>'"
     )
 
-    assert (
-        "contact updated successfully" in response.lower()
+    assert contains_ci(
+        response, "deal created successfully"
     ), f"Expected success phrase not found in response: {response}"
-    assert response, "No response returned from update_contact"
 
-    print(f"Response: {response}")
-    print("✅ update_contact passed.")
-
-
-@pytest.mark.asyncio
-async def test_list_account_stages(client):
-    """Test listing available account stages."""
+    logger.debug("Response: %s", response)
+
+    return _extract_id(response)
+
+
+@pytest.fixture(scope="session")
+def state(request):
+    """IDs of Apollo objects created by the tests, persisted in the pytest cache.
+
+    Accounts and deals can't be deleted through the API, so their IDs are
+    kept across runs and re-running a single failed test (e.g. with --lf)
+    reuses them instead of creating new ones first. The fixtures that reuse
+    an ID first check that the object still exists. --fresh-state starts
+    from an empty state and records the new IDs.
+    """
+    cache = getattr(request.config, "cache", None)
+    state = {}
+    if cache is not None and not request.config.getoption("--fresh-state"):
+        state = cache.get("apollo/state", {})
+
+    yield state
+
+    if cache is not None:
+        cache.set("apollo/state", state)
+
+
+async def _still_exists(apollo_http, path):
+    """Whether an object recorded by an earlier run can still be fetched."""
+    response = await apollo_http.get(path)
+    if response.status_code == 404:
+        return False
+    response.raise_for_status()
+    return True
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def created_account(client, apollo_http, data, state):
+    """ID of the test account, created unless an earlier test or run recorded one that still exists."""
+    account_id = state.get("account_id")
+    if account_id and not await _still_exists(apollo_http, f"/accounts/{account_id}"):
+        logger.warning(
+            "Recorded Apollo account %s is gone, creating a new one", account_id
+        )
+        account_id = None
+        # A recorded deal belongs to the old account
+        state.pop("deal_id", None)
+    if not account_id:
+        state["account_id"] = await _create_account(client, data)
+    return state["account_id"]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def created_deal(client, apollo_http, created_account, data, state):
+    """ID of the test deal, created unless an earlier test or run recorded one that still exists."""
+    deal_id = state.get("deal_id")
+    if deal_id and not await _still_exists(apollo_http, f"/opportunities/{deal_id}"):
+        logger.warning("Recorded Apollo deal %s is gone, creating a new one", deal_id)
+        deal_id = None
+    if not deal_id:
+        state["deal_id"] = await _create_deal(client, data, created_account)
+    return state["deal_id"]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def apollo_lookups(client):
+    """Fetch contact/account/deal stages and users in a single query.
+
+    These lookups are read-only and static for the duration of a run, so
+    one round-trip is shared by all the list_* tests.
+    """
     response = await client.process_query(
-        "Use the list_account_stages tool to get available account stages."
+        "Use the list_contact_stages, list_account_stages, list_deal_stages "
+        "and list_users tools. For each tool, list the ID of every item it returned."
     )
 
-    assert response, "No response returned from list_account_stages"
-    assert (
-        "account stages" in response.lower()
-    ), f"Expected account stages in response: {response}"
+    logger.debug("Response: %s", response)
 
-    print(f"Response: {response}")
-    print("✅ list_account_stages passed.")
+    return response
 
 
 @pytest.mark.asyncio
-async def test_create_account(client):
-    """Test creating a new account."""
-    global account_id
-
+async def test_create_contact(client, apollo_http, data):
+    """Test creating a new contact."""
     response = await client.process_query(
-        f"Use the create_account tool to create an account with the following details: "
-        f"Name: {test_account['name']}, "
-        f"Domain: {test_account['domain']}, "
-        f"Phone: {test_account['phone']}, "
-        f"Raw Address: {test_account['raw_address']}. "
-        "If successful, start your response with 'Account created successfully' and return the account ID."
-        "Please return the account ID in the format 'ID: <account_id>'"
+        f"Use the create_contact tool to create a contact with the following details: "
+        f"First Name: {data['contact']['first_name']}, "
+        f"Last Name: {data['contact']['last_name']}, "
+        f"Organization Name: {data['contact']['organization_name']}, "
+        f"Title: {data['contact']['title']}, "
+        f"Email: {data['contact']['email']}. "
+        "If successful, start your response with 'Contact created successfully' and return the contact ID."
+        "Please return the contact ID in the format 'ID: <contact_id>'"
     )
 
-    assert (
-        "account created successfully" in response.lower()
+    logger.debug("Response: %s", response)
+
+    assert contains_ci(
+        response, "contact created successfully"
     ), f"Expected success phrase not found in response: {response}"
-    assert response, "No response returned from create_account"
 
-    try:
-        account_id = response.lower().split("id:")[1].strip()
-    except Exception as e:
-        assert (
-            False
-        ), f"Error parsing account ID from response: {response} with error: {str(e)}"
+    contact_id = _extract_id(response)
+    logger.info("Created contact ID: %s", contact_id)
+
+    # Other tests use seeded_contact, so this contact is only needed here
+    await _delete_contact(apollo_http, contact_id)
 
-    print(f"Response: {response}")
-    print("✅ create_account passed.")
+    _report_pass("create_contact")
 
 
 @pytest.mark.asyncio
-async def test_search_accounts(client):
-    """Test searching for accounts."""
+async def test_update_contact(client, apollo_http, seeded_contact, data):
+    """Test updating an existing contact."""
     response = await client.process_query(
-        f"Use the search_accounts tool to search for accounts with the following criteria: "
-        f"Organization Name: {test_account['name']}. "
-        "If successful, start your response with 'Accounts found successfully'."
+        f"Use the update_contact tool to update the contact with the following details: "
+        f"Contact ID: {seeded_contact}, "
+        f"First Name: {data['contact_updated']['first_name']}, "
+        f"Last Name: {data['contact_updated']['last_name']}, "
+        f"Organization Name: {data['contact_updated']['organization_name']}, "
+        f"Title: {data['contact_updated']['title']}, "
+        f"Email: {data['contact_updated']['email']}. "
+        "If successful, start your response with 'Contact updated successfully'."
     )
 
-    assert (
-        "accounts found successfully" in response.lower()
+    assert contains_ci(
+        response, "contact updated successfully"
     ), f"Expected success phrase not found in response: {response}"
-    assert response, "No response returned from search_accounts"
-
-    print(f"Response: {response}")
-    print("✅ search_accounts passed.")
-
-
-@pytest.mark.asyncio
-async def test_update_account(client):
-    """Test updating an existing account."""
-    global account_id
-
-    response = await client.process_query(
-        f"Use the update_account tool to update the account with the following details: "
-        f"Account ID: {account_id}, "
-        f"Name: {test_account_updated['name']}, "
-        f"Domain: {test_account_updated['domain']}, "
-        f"Phone: {test_account_updated['phone']}, "
-        f"Raw Address: {test_account_updated['raw_address']}. "
-        "If successful, start your response with 'Account updated successfully'."
-    )
+    assert response, "No response returned from update_contact"
 
+    # Verify the update landed in Apollo without another LLM round-trip
+    lookup = await apollo_http.get(f"/contacts/{seeded_contact}")
+    lookup.raise_for_status()
+    contact = lookup.json()["contact"]
     assert (
-        "account updated successfully" in response.lower()
-    ), f"Expected success phrase not found in response: {response}"
-    assert response, "No response returned from update_account"
+        contact["last_name"] == data["contact_updated"]["last_name"]
+    ), f"Contact was not updated in Apollo: {contact}"
 
-    print(f"Response: {response}")
-    print("✅ update_account passed.")
+    logger.debug("Response: %s", response)
+    _report_pass("update_contact")
 
 
 @pytest.mark.asyncio
-async def test_list_deal_stages(client):
-    """Test listing available deal stages."""
-    response = await client.process_query(
-        "Use the list_deal_stages tool to get available deal stages."
-    )
-
-    assert response, "No response returned from list_deal_stages"
-    assert (
-        "deal stages" in response.lower()
-    ), f"Expected deal stages in response: {response}"
+async def test_create_account(client, data, state):
+    """Test creating a new account."""
+    account_id = await _create_account(client, data)
+    assert account_id, "No account ID returned from create_account"
+    state["account_id"] = account_id
 
-    print(f"Response: {response}")
-    print("✅ list_deal_stages passed.")
+    logger.info("Created account ID: %s", account_id)
+    _report_pass("create_account")
 
 
 @pytest.mark.asyncio
-async def test_create_deal(client):
-    """Test creating a new deal."""
-    global deal_id
-
+async def test_update_account(client, apollo_http, created_account, data):
+    """Test updating an existing account."""
     response = await client.process_query(
-        f"Use the create_deal tool to create a deal with the following details: "
-        f"Name: {test_deal['name']}, "
-        f"Account ID: {account_id}, "
-        f"Amount: {test_deal['amount']}, "
-        f"Closed Date: {test_deal['closed_date']}. "
-        "If successful, start your response with 'Deal created successfully' and return the deal ID."
-        "Please return the deal ID in the format 'ID: <deal_id>'"
+        f"Use the update_account tool to update the account with the following details: "
+        f"Account ID: {created_account}, "
+        f"Name: {data['account_updated']['name']}, "
+        f"Domain: {data['account_updated']['domain']}, "
+        f"Phone: {data['account_updated']['phone']}, "
+        f"Raw Address: {data['account_updated']['raw_address']}. "
+        "If successful, start your response with 'Account updated successfully'."
     )
 
-    assert (
-        "deal created successfully" in response.lower()
+    assert contains_ci(
+        response, "account updated successfully"
     ), f"Expected success phrase not found in response: {response}"
-    assert response, "No response returned from create_deal"
+    assert response, "No response returned from update_account"
 
-    try:
-        deal_id = response.lower().split("id:")[1].strip()
-    except Exception as e:
-        assert (
-            False
-        ), f"Error parsing deal ID from response: {response} with error: {str(e)}"
+    # Verify the update landed in Apollo without another LLM round-trip
+    lookup = await apollo_http.get(f"/accounts/{created_account}")
+    lookup.raise_for_status()
+    account = lookup.json()["account"]
+    assert (
+        account["name"] == data["account_updated"]["name"]
+    ), f"Account was not updated in Apollo: {account}"
 
-    print(f"Response: {response}")
-    print("✅ create_deal passed.")
+    logger.debug("Response: %s", response)
+    _report_pass("update_account")
 
 
 @pytest.mark.asyncio
-async def test_list_deals(client):
-    """Test listing all deals."""
-    response = await client.process_query("Use the list_deals tool to get all deals.")
-
-    assert response, "No response returned from list_deals"
-    assert "deals" in response.lower(), f"Expected deals in response: {response}"
+async def test_create_deal(client, created_account, data, state):
+    """Test creating a new deal."""
+    deal_id = await _create_deal(client, data, created_account)
+    assert deal_id, "No deal ID returned from create_deal"
+    state["deal_id"] = deal_id
 
-    print(f"Response: {response}")
-    print("✅ list_deals passed.")
+    logger.info("Created deal ID: %s", deal_id)
+    _report_pass("create_deal")
 
 
 @pytest.mark.asyncio
-async def test_update_deal(client):
+async def test_update_deal(client, apollo_http, created_deal, data):
     """Test updating an existing deal."""
-    global deal_id
-
     response = await client.process_query(
         f"Use the update_deal tool to update the deal with the following details: "
-        f"Opportunity ID: {deal_id}, "
-        f"Name: {test_deal_updated['name']}, "
-        f"Amount: {test_deal_updated['amount']}, "
-        f"Closed Date: {test_deal_updated['closed_date']}. "
+        f"Opportunity ID: {created_deal}, "
+        f"Name: {data['deal_updated']['name']}, "
+        f"Amount: {data['deal_updated']['amount']}, "
+        f"Closed Date: {data['deal_updated']['closed_date']}. "
         "If successful, start your response with 'Deal updated successfully'."
     )
 
-    assert (
-        "deal updated successfully" in response.lower()
+    assert contains_ci(
+        response, "deal updated successfully"
     ), f"Expected success phrase not found in response: {response}"
     assert response, "No response returned from update_deal"
 
-    print(f"Response: {response}")
-    print("✅ update_deal passed.")
-
-
-@pytest.mark.asyncio
-async def test_list_users(client):
-    """Test listing all users."""
-    response = await client.process_query("Use the list_users tool to get all users.")
-
-    assert response, "No response returned from list_users"
-    assert "users" in response.lower(), f"Expected users in response: {response}"
+    # Verify the update landed in Apollo without another LLM round-trip
+    lookup = await apollo_http.get(f"/opportunities/{created_deal}")
+    lookup.raise_for_status()
+    deal = lookup.json()["opportunity"]
+    assert (
+        deal["name"] == data["deal_updated"]["name"]
+    ), f"Deal was not updated in Apollo: {deal}"
 
-    print(f"Response: {response}")
-    print("✅ list_users passed.")
+    logger.debug("Response: %s", response)
+    _report_pass("update_deal")
 
 
 @pytest.mark.asyncio
-async def test_create_task(client):
-    """Test creating a new task."""
-
-    response = await client.process_query(
-        f"Use the create_task tool to create a task with the following details: "
-        f"User ID: 1, "
-        f"Contact ID: [{contact_id}], "
-        f"Priority: {test_task['priority']}, "
-        f"Due At: {test_task['due_at']}, "
-        f"Type: {test_task['type']}, "
-        f"Status: {test_task['status']}, "
-        f"Note: {test_task['note']}. "
-        "If successful, start your response with 'Task created successfully'"
+async def test_readonly_queries(client, data):
+    """Test the independent read-only tools concurrently.
+
+    list_deals, enrich_person and enrich_organization do not depend on each
+    other or on any created object, so they are issued together and the
+    test waits for the slowest one instead of the sum of all three.
+    """
+    checks = [
+        (
+            "list_deals",
+            "Use the list_deals tool to get all deals.",
+            "deals",
+        ),
+        (
+            "enrich_person",
+            f"Use the enrich_person tool to enrich data for a person with the following details: "
+            f"First Name: {data['contact']['first_name']}, "
+            f"Last Name: {data['contact']['last_name']}, "
+            f"Email: {data['contact']['email']}. "
+            "If successful, start your response with 'Person data enriched successfully'.",
+            "person data enriched successfully",
+        ),
+        (
+            "enrich_organization",
+            "Use the enrich_organization tool to enrich data for an organization with the following details: "
+            "Domain: Gumloop.com "
+            "If successful, start your response with 'Organization data enriched successfully'.",
+            "organization data enriched successfully",
+        ),
+    ]
+
+    responses = await asyncio.gather(
+        *(client.process_query(prompt) for _, prompt, _ in checks)
     )
 
-    assert (
-        "task created successfully" in response.lower()
-    ), f"Expected success phrase not found in response: {response}"
-    assert response, "No response returned from create_task"
+    for (tool_name, _, phrase), response in zip(checks, responses):
+        assert response, f"No response returned from {tool_name}"
+        assert contains_ci(
+            response, phrase
+        ), f"Expected '{phrase}' in {tool_name} response: {response}"
 
-    print(f"Response: {response}")
-    print("✅ create_task passed.")
+        logger.debug("Response: %s", response)
+        _report_pass(tool_name)
 
 
+@pytest.mark.parametrize(
+    "tool_name, path, key", LOOKUP_TESTS, ids=[name for name, _, _ in LOOKUP_TESTS]
+)
 @pytest.mark.asyncio
-async def test_enrich_person(client):
-    """Test enriching person data."""
-    response = await client.process_query(
-        f"Use the enrich_person tool to enrich data for a person with the following details: "
-        f"First Name: {test_contact['first_name']}, "
-        f"Last Name: {test_contact['last_name']}, "
-        f"Email: {test_contact['email']}. "
-        "If successful, start your response with 'Person data enriched successfully'."
-    )
+async def test_lookup(apollo_lookups, apollo_http, tool_name, path, key):
+    """Test the list_* lookup tools against the shared lookup response.
 
-    assert (
-        "person data enriched successfully" in response.lower()
-    ), f"Expected success phrase not found in response: {response}"
-    assert response, "No response returned from enrich_person"
+    The response must contain an ID the Apollo API returns for the same
+    lookup, which the model can only know from the tool's output.
+    """
+    assert apollo_lookups, f"No response returned from {tool_name}"
 
-    print(f"Response: {response}")
-    print("✅ enrich_person passed.")
+    lookup = await apollo_http.get(path)
+    lookup.raise_for_status()
+    ids = [item["id"] for item in lookup.json().get(key, [])]
+    if not ids:
+        pytest.skip(f"No {key} in this Apollo account")
 
+    assert contains_ci(
+        apollo_lookups, *ids
+    ), f"Expected one of the {key} IDs {ids} in response: {apollo_lookups}"
 
-@pytest.mark.asyncio
-async def test_enrich_organization(client):
-    """Test enriching organization data."""
-    response = await client.process_query(
-        "Use the enrich_organization tool to enrich data for an organization with the following details: "
-        "Domain: Gumloop.com "
-        "If successful, start your response with 'Organization data enriched successfully'."
-    )
+    _report_pass(tool_name)
 
-    assert (
-        "organization data enriched successfully" in response.lower()
+
+@pytest.mark.parametrize(
+    "tool_name, build_prompt, phrase",
+    TOOL_TESTS,
+    ids=[name for name, _, _ in TOOL_TESTS],
+)
+@pytest.mark.asyncio
+async def test_tool(
+    client, data, seeded_contact, created_account, tool_name, build_prompt, phrase
+):
+    """Test a tool whose only check is a success phrase in the response."""
+    ids = {"contact_id": seeded_contact, "account_id": created_account}
+    response = await client.process_query(build_prompt(data, ids))
+
+    assert response, f"No response returned from {tool_name}"
+    assert contains_ci(
+        response, phrase
     ), f"Expected success phrase not found in response: {response}"
-    assert response, "No response returned from enrich_organization"
 
-    print(f"Response: {response}")
-    print("✅ enrich_organization passed.")
+    logger.debug("Response: %s", response)
+    _report_pass(tool_name)
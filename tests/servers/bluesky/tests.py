@@ -1,4 +1,7 @@
 import pytest
+import pytest_asyncio
+
+from tests.utils.test_tools import query_response, run_queries_concurrently
 
 # Global variables to store IDs across tests
 test_post_uri = None
@@ -6,6 +9,36 @@ test_post_uri = None
 # Replace with your handle
 test_handle = "<handle>.bsky.social"
 
+search_query = "test"
+
+# Queries of the read-only tools, which don't depend on each other or on the
+# posts and follows the other tests create
+READ_QUERIES = {
+    "get_my_profile": "Use the get_my_profile tool to fetch your profile information. "
+    "If successful, start your response with 'Profile information retrieved successfully' and include your handle.",
+    "get_posts": f"Use the get_posts tool to fetch recent posts from handle '{test_handle}'. "
+    "If successful, start your response with 'Successfully retrieved posts' and list them.",
+    "get_liked_posts": "Use the get_liked_posts tool to fetch posts you have liked. "
+    "If successful, start your response with 'Successfully retrieved liked posts' and list them.",
+    "search_posts": f"Use the search_posts tool to search for posts containing '{search_query}'. "
+    "If successful, start your response with 'Successfully found search results' and list them.",
+    "search_profiles": f"Use the search_profiles tool to search for profiles containing '{search_query}'. "
+    "If successful, start your response with 'Successfully found profile search results' and list them.",
+    "get_follows": "Use the get_follows tool to fetch accounts you follow. "
+    "If successful, start your response with 'Successfully retrieved following list' and list the accounts.",
+}
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def read_responses(client):
+    """Responses to READ_QUERIES, issued concurrently once per module.
+
+    The read-only tests only check their own response, so the module waits
+    for the slowest query instead of the sum of all of them.
+    """
+    return await run_queries_concurrently(client, READ_QUERIES)
+
+
 # ================================
 # Test list and read resources
 # ================================
@@ -98,25 +131,24 @@ async def test_read_resource(client):
 
 
 @pytest.mark.asyncio
-async def test_get_my_profile(client):
+async def test_get_my_profile(read_responses):
     """Get the current user's profile information.
 
     Args:
-        client: The test client fixture for the MCP server.
+        read_responses: Responses of the read-only queries, by tool name.
     """
-    response = await client.process_query(
-        "Use the get_my_profile tool to fetch your profile information. "
-        "If successful, start your response with 'Profile information retrieved successfully' and include your handle."
-    )
+    response = query_response(read_responses, "get_my_profile")
 
     # Check for HTTP error codes
     if "status_code=4" in response:
         pytest.fail(f"HTTP error encountered: {response}")
 
+    response_lower = response.lower()
+
     assert (
-        "profile information retrieved successfully" in response.lower()
+        "profile information retrieved successfully" in response_lower
     ), f"Expected success phrase not found in response: {response}"
-    assert "handle" in response.lower(), f"Handle not found in response: {response}"
+    assert "handle" in response_lower, f"Handle not found in response: {response}"
 
     print(f"Response: {response}")
     print("✅ get_my_profile passed.")
@@ -146,28 +178,27 @@ async def test_create_post(client):
         "post created successfully" in response.lower()
     ), f"Expected success phrase not found in response: {response}"
 
-    try:
-        test_post_uri = response.split("URI: ")[1].strip()
-        print(f"Post URI: {test_post_uri}")
-    except IndexError:
+    uri_start = response.find("URI: ")
+    uri_tail = response[uri_start + len("URI: ") :].split(None, 1)
+    if uri_start == -1 or not uri_tail:
         print("No post URI found in response")
         pytest.fail("No post URI found in response")
 
+    test_post_uri = uri_tail[0]
+    print(f"Post URI: {test_post_uri}")
+
     print(f"Response: {response}")
     print("✅ create_post passed.")
 
 
 @pytest.mark.asyncio
-async def test_get_posts(client):
+async def test_get_posts(read_responses):
     """Get recent posts from a user.
 
     Args:
-        client: The test client fixture for the MCP server.
+        read_responses: Responses of the read-only queries, by tool name.
     """
-    response = await client.process_query(
-        f"Use the get_posts tool to fetch recent posts from handle '{test_handle}'. "
-        "If successful, start your response with 'Successfully retrieved posts' and list them."
-    )
+    response = query_response(read_responses, "get_posts")
 
     # Check for HTTP error codes
     if "status_code=4" in response:
@@ -183,16 +214,13 @@ async def test_get_posts(client):
 
 
 @pytest.mark.asyncio
-async def test_get_liked_posts(client):
+async def test_get_liked_posts(read_responses):
     """Get posts liked by the user.
 
     Args:
-        client: The test client fixture for the MCP server.
+        read_responses: Responses of the read-only queries, by tool name.
     """
-    response = await client.process_query(
-        "Use the get_liked_posts tool to fetch posts you have liked. "
-        "If successful, start your response with 'Successfully retrieved liked posts' and list them."
-    )
+    response = query_response(read_responses, "get_liked_posts")
 
     # Check for HTTP error codes
     if "status_code=4" in response:
@@ -207,28 +235,25 @@ async def test_get_liked_posts(client):
 
 
 @pytest.mark.asyncio
-async def test_search_posts(client):
+async def test_search_posts(read_responses):
     """Search for posts.
 
     Args:
-        client: The test client fixture for the MCP server.
+        read_responses: Responses of the read-only queries, by tool name.
     """
-    search_query = "test"
-
-    response = await client.process_query(
-        f"Use the search_posts tool to search for posts containing '{search_query}'. "
-        "If successful, start your response with 'Successfully found search results' and list them."
-    )
+    response = query_response(read_responses, "search_posts")
 
     # Check for HTTP error codes
     if "status_code=4" in response:
         pytest.fail(f"HTTP error encountered: {response}")
 
+    response_lower = response.lower()
+
     assert (
-        "successfully found search results" in response.lower()
+        "successfully found search results" in response_lower
     ), f"Expected success phrase not found in response: {response}"
     assert (
-        search_query in response.lower()
+        search_query in response_lower
     ), f"Search query not found in response: {response}"
 
     print(f"Response: {response}")
@@ -236,28 +261,25 @@ async def test_search_posts(client):
 
 
 @pytest.mark.asyncio
-async def test_search_profiles(client):
+async def test_search_profiles(read_responses):
     """Search for user profiles.
 
     Args:
-        client: The test client fixture for the MCP server.
+        read_responses: Responses of the read-only queries, by tool name.
     """
-    search_query = "test"
-
-    response = await client.process_query(
-        f"Use the search_profiles tool to search for profiles containing '{search_query}'. "
-        "If successful, start your response with 'Successfully found profile search results' and list them."
-    )
+    response = query_response(read_responses, "search_profiles")
 
     # Check for HTTP error codes
     if "status_code=4" in response:
         pytest.fail(f"HTTP error encountered: {response}")
 
+    response_lower = response.lower()
+
     assert (
-        "successfully found profile search results" in response.lower()
+        "successfully found profile search results" in response_lower
     ), f"Expected success phrase not found in response: {response}"
     assert (
-        search_query in response.lower()
+        search_query in response_lower
     ), f"Search query not found in response: {response}"
 
     print(f"Response: {response}")
@@ -265,16 +287,13 @@ async def test_search_profiles(client):
 
 
 @pytest.mark.asyncio
-async def test_get_follows(client):
+async def test_get_follows(read_responses):
     """Get list of accounts the user follows.
 
     Args:
-        client: The test client fixture for the MCP server.
+        read_responses: Responses of the read-only queries, by tool name.
     """
-    response = await client.process_query(
-        "Use the get_follows tool to fetch accounts you follow. "
-        "If successful, start your response with 'Successfully retrieved following list' and list the accounts."
-    )
+    response = query_response(read_responses, "get_follows")
 
     # Check for HTTP error codes
     if "status_code=4" in response:
@@ -288,6 +307,47 @@ async def test_get_follows(client):
     print("✅ get_follows passed.")
 
 
+@pytest.mark.asyncio
+async def test_social_lifecycle(client):
+    """Follow, unfollow, mute, unmute, block and unblock a user in one query.
+
+    Covers the same tools as the per-step tests, which only run with
+    --granular, in a single conversation.
+
+    Args:
+        client: The test client fixture for the MCP server.
+    """
+    steps = [
+        ("follow_user", "follow", "Successfully followed user"),
+        ("unfollow_user", "unfollow", "Successfully unfollowed user"),
+        ("mute_user", "mute", "Successfully muted user"),
+        ("unmute_user", "unmute", "Successfully unmuted user"),
+        ("block_user", "block (with reason 'other')", "Successfully blocked user"),
+        ("unblock_user", "unblock", "Successfully unblocked user"),
+    ]
+    instructions = " ".join(
+        f"{i}. Use the {tool} tool to {action} the user with handle '{test_handle}'. "
+        f"If successful, write a line starting with '{phrase}'."
+        for i, (tool, action, phrase) in enumerate(steps, start=1)
+    )
+    response = await client.process_query(
+        "Perform these steps in order, waiting for each tool's result before "
+        f"calling the next one: {instructions}"
+    )
+
+    # Check for HTTP error codes
+    if "status_code=4" in response:
+        pytest.fail(f"HTTP error encountered: {response}")
+
+    response_lower = response.lower()
+    failed = [tool for tool, _, phrase in steps if phrase.lower() not in response_lower]
+    assert not failed, f"Steps without a success phrase {failed}: {response}"
+
+    print(f"Response: {response}")
+    print("✅ social lifecycle passed.")
+
+
+@pytest.mark.granular
 @pytest.mark.asyncio
 async def test_follow_user(client):
     """Follow another user.
@@ -313,6 +373,7 @@ async def test_follow_user(client):
     print("✅ follow_user passed.")
 
 
+@pytest.mark.granular
 @pytest.mark.asyncio
 async def test_unfollow_user(client):
     """Unfollow a user.
@@ -338,6 +399,7 @@ async def test_unfollow_user(client):
     print("✅ unfollow_user passed.")
 
 
+@pytest.mark.granular
 @pytest.mark.asyncio
 async def test_mute_user(client):
     """Mute a user.
@@ -363,6 +425,7 @@ async def test_mute_user(client):
     print("✅ mute_user passed.")
 
 
+@pytest.mark.granular
 @pytest.mark.asyncio
 async def test_unmute_user(client):
     """Unmute a user.
@@ -388,6 +451,7 @@ async def test_unmute_user(client):
     print("✅ unmute_user passed.")
 
 
+@pytest.mark.granular
 @pytest.mark.asyncio
 async def test_block_user(client):
     """Block a user.
@@ -413,6 +477,7 @@ async def test_block_user(client):
     print("✅ block_user passed.")
 
 
+@pytest.mark.granular
 @pytest.mark.asyncio
 async def test_unblock_user(client):
     """Unblock a user.
@@ -443,6 +508,9 @@ async def test_delete_post(client):
     """
     Delete a post.
     """
+    if not test_post_uri:
+        pytest.skip("No post URI available - run create_post test first")
+
     # Now delete the post
     delete_response = await client.process_query(
         f"Use the delete_post tool to delete the post with URI '{test_post_uri}'"
@@ -1,6 +1,5 @@
 import pytest
 import re
-import json
 from datetime import datetime, timedelta, timezone
 import random
 
@@ -1,293 +1,313 @@
+import re
 import pytest
+import logging
+import pytest_asyncio
+from types import SimpleNamespace
 from datetime import datetime, timedelta
 
+from tests.utils.test_tools import (
+    contains_ci,
+    find_first_resources,
+    query_response,
+    read_first_resources,
+    run_queries_concurrently,
+)
+
+logger = logging.getLogger(__name__)
+
+EVENT_TYPE_URI_PREFIX = "calendly://event_type/"
+EVENT_URI_PREFIX = "calendly://event/"
+EVENT_ID_PATTERN = re.compile(r"ID:\s*([A-Za-z0-9\-_]+)")
+
+
+# Templates of the prompts that take run-time values, filled with str.format
+SCHEDULED_EVENTS_PROMPT = (
+    "Use the list_scheduled_events tool to list all active events "
+    "between {start} and {end}. "
+    "If successful, start your response with 'Found scheduled events:' and list them. "
+    "If no events are found, start with 'No scheduled events found:'."
+)
+AVAILABILITY_PROMPT = (
+    "Use the get_availability tool to check available times for event type with ID '{event_type_id}' "
+    "between {start} and {end}. "
+    "If successful, start your response with 'Found available slots:' and list them. "
+    "If no slots are found, start with 'No available slots found:'."
+)
+SCHEDULING_LINK_PROMPT = (
+    "Use the create_scheduling_link tool to create a single-use link for event type ID '{event_type_id}'. "
+    "If successful, start your response with 'Created scheduling link:' and include the link. "
+    "If unsuccessful, start with 'Failed to create scheduling link:'."
+)
+CANCEL_EVENT_PROMPT = (
+    "Use the cancel_event tool to cancel the event with ID '{event_id}' "
+    "with reason 'Automated test cancellation - please ignore'. "
+    "If successful, start your response with 'Successfully canceled event:' and include the event ID. "
+    "If unsuccessful, start with 'Failed to cancel event:'."
+)
+
+
+@pytest.fixture(scope="session")
+def date_window():
+    """ISO dates the tests ask about, computed once per session"""
+    now = datetime.now()
+    return SimpleNamespace(
+        today=now.date().isoformat(),
+        week_from_now=(now + timedelta(days=7)).date().isoformat(),
+        thirty_days_ago=(now - timedelta(days=30)).date().isoformat(),
+        thirty_days_from_now=(now + timedelta(days=30)).date().isoformat(),
+    )
 
-@pytest.mark.asyncio
-async def test_list_resources(client):
-    """Test listing event types and scheduled events from Calendly"""
-    response = await client.list_resources()
-    assert (
-        response and hasattr(response, "resources") and len(response.resources)
-    ), f"Invalid list resources response: {response}"
-
-    print("Resources found:")
-    for resource in response.resources:
-        print(f"  - {resource.name} ({resource.uri}) - Type: {resource.mimeType}")
 
-    print("✅ Successfully listed resources")
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def read_responses(client, date_window):
+    """Responses of the read-only list queries, issued concurrently once per module.
+
+    None of them depend on each other or on the events the other tests
+    cancel, so the module waits for the slowest query instead of their sum.
+    """
+    return await run_queries_concurrently(
+        client,
+        {
+            "list_event_types": "Use the list_event_types tool to list all available event types. "
+            "Include both active and inactive event types. "
+            "If successful, start your response with 'Found event types:' and list them. "
+            "If no event types are found, start with 'No event types found:'.",
+            "list_active_event_types": "Use the list_event_types tool to list only active event types. "
+            "Set active_only to true. "
+            "If successful, start your response with 'Found active event types:' and list them. "
+            "If no active event types are found, start with 'No active event types found:'.",
+            "list_scheduled_events": SCHEDULED_EVENTS_PROMPT.format(
+                start=date_window.thirty_days_ago, end=date_window.thirty_days_from_now
+            ),
+            "list_canceled_events": "Use the list_scheduled_events tool to list all canceled events from the last 60 days. "
+            "If successful, start your response with 'Found canceled events:' and list them. "
+            "If no canceled events are found, start with 'No canceled events found:'.",
+        },
+    )
 
 
-@pytest.mark.asyncio
-async def test_read_event_type(client):
-    """Test reading an event type resource"""
-    response = await client.list_resources()
-    assert (
-        response and hasattr(response, "resources") and len(response.resources)
-    ), f"Invalid list resources response: {response}"
+@pytest.fixture(scope="module")
+def first_resources(resources):
+    """First listed event type and scheduled event, found in one pass over the resources.
 
-    event_type_resource = next(
-        (
-            r
-            for r in response.resources
-            if str(r.uri).startswith("calendly://event_type/")
-        ),
-        None,
+    Maps "event_type" and "event" to the resource, or to None if the server
+    listed no resource of that kind.
+    """
+    return find_first_resources(
+        resources, {"event_type": EVENT_TYPE_URI_PREFIX, "event": EVENT_URI_PREFIX}
     )
 
-    if not event_type_resource:
-        pytest.skip("No event type resources found - skipping test")
 
-    response = await client.read_resource(event_type_resource.uri)
-    assert response.contents, "Response should contain event type data"
-    assert response.contents[0].mimeType == "application/json", "Expected JSON response"
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def first_resource_contents(client, first_resources):
+    """read_resource responses of the first event type and scheduled event, read concurrently.
 
-    print("Event type data read:")
-    print(f"\t{response.contents[0].text}")
-    print("✅ Successfully read event type data")
+    Maps "event_type" and "event" to the response, to the error reading it
+    raised, or to None if the server listed no resource of that kind.
+    """
+    return await read_first_resources(client, first_resources)
+
+
+@pytest.fixture(scope="module")
+def event_type_id(first_resources):
+    """ID of the first listed event type, skipping the test if there is none"""
+    if not first_resources["event_type"]:
+        pytest.skip("No event type resources found - skipping test")
+
+    return str(first_resources["event_type"].uri)[len(EVENT_TYPE_URI_PREFIX) :]
 
 
 @pytest.mark.asyncio
-async def test_read_event(client):
-    """Test reading a scheduled event resource"""
-    response = await client.list_resources()
+async def test_list_resources(resources):
+    """Test listing event types and scheduled events from Calendly"""
+    response = resources
     assert (
         response and hasattr(response, "resources") and len(response.resources)
     ), f"Invalid list resources response: {response}"
 
-    event_resource = next(
-        (r for r in response.resources if str(r.uri).startswith("calendly://event/")),
-        None,
-    )
+    for resource in response.resources:
+        logger.debug(
+            "Resource found: %s (%s) - Type: %s",
+            resource.name,
+            resource.uri,
+            resource.mimeType,
+        )
+
+    print("✅ Successfully listed resources")
 
-    if not event_resource:
-        pytest.skip("No scheduled event resources found - skipping test")
 
-    response = await client.read_resource(event_resource.uri)
-    assert response.contents, "Response should contain scheduled event data"
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "kind, label",
+    [("event_type", "event type"), ("event", "scheduled event")],
+    ids=["event_type", "event"],
+)
+async def test_read_typed_resource(first_resource_contents, kind, label):
+    """Test reading the first event type and scheduled event resource"""
+    if first_resource_contents[kind] is None:
+        pytest.skip(f"No {label} resources found - skipping test")
+
+    response = query_response(first_resource_contents, kind)
+    assert response.contents, f"Response should contain {label} data"
     assert response.contents[0].mimeType == "application/json", "Expected JSON response"
 
-    print("Scheduled event data read:")
-    print(f"\t{response.contents[0].text}")
-    print("✅ Successfully read scheduled event data")
+    logger.debug("%s data read: %s", label.capitalize(), response.contents[0].text)
+    print(f"✅ Successfully read {label} data")
 
 
 @pytest.mark.asyncio
-async def test_list_event_types_tool(client):
+async def test_list_event_types_tool(read_responses):
     """Test listing event types using the list_event_types tool"""
-    response = await client.process_query(
-        "Use the list_event_types tool to list all available event types. "
-        "Include both active and inactive event types. "
-        "If successful, start your response with 'Found event types:' and list them. "
-        "If no event types are found, start with 'No event types found:'."
-    )
+    response = query_response(read_responses, "list_event_types")
 
     assert response, "No response received from list_event_types tool"
-    assert any(
-        ["Found event types:" in response, "No event types found:" in response]
+    assert (
+        "Found event types:" in response or "No event types found:" in response
     ), "Response must start with either 'Found event types:' or 'No event types found:'"
 
     if "Found event types:" in response:
-        assert (
-            "min" in response.lower() or "duration" in response.lower()
+        assert contains_ci(
+            response, "min", "duration"
         ), "Response should contain event type details"
     else:
-        assert (
-            "no event types" in response.lower()
+        assert contains_ci(
+            response, "no event types"
         ), "Response should indicate no event types found"
 
-    print("Event types listed:")
-    print(f"\t{response}")
+    logger.debug("Event types listed: %s", response)
 
     print("✅ Successfully listed event types")
 
 
 @pytest.mark.asyncio
-async def test_list_event_types_active_only(client):
+async def test_list_event_types_active_only(read_responses):
     """Test listing only active event types using the list_event_types tool"""
-    response = await client.process_query(
-        "Use the list_event_types tool to list only active event types. "
-        "Set active_only to true. "
-        "If successful, start your response with 'Found active event types:' and list them. "
-        "If no active event types are found, start with 'No active event types found:'."
-    )
+    response = query_response(read_responses, "list_active_event_types")
 
     assert response, "No response received from list_event_types tool"
-    assert any(
-        [
-            "Found active event types:" in response,
-            "No active event types found:" in response,
-        ]
+    assert (
+        "Found active event types:" in response
+        or "No active event types found:" in response
     ), "Response must start with either 'Found active event types:' or 'No active event types found:'"
 
     if "Found active event types:" in response:
-        assert (
-            "active" in response.lower()
+        assert contains_ci(
+            response, "active"
         ), "Response should mention active event types"
     else:
-        assert (
-            "no active" in response.lower()
+        assert contains_ci(
+            response, "no active"
         ), "Response should indicate no active event types found"
 
-    print("Active event types listed:")
-    print(f"\t{response}")
+    logger.debug("Active event types listed: %s", response)
 
     print("✅ Successfully listed active event types")
 
 
 @pytest.mark.asyncio
-async def test_get_availability_tool(client):
+async def test_get_availability_tool(client, event_type_id, date_window):
     """Test getting availability for an event type"""
-    response = await client.list_resources()
-    event_type_resource = next(
-        (
-            r
-            for r in response.resources
-            if str(r.uri).startswith("calendly://event_type/")
-        ),
-        None,
-    )
-
-    if not event_type_resource:
-        pytest.skip("No event type resources found - skipping test")
-
-    event_type_id = str(event_type_resource.uri).replace("calendly://event_type/", "")
-
-    today = datetime.now().date().isoformat()
-    week_from_now = (datetime.now() + timedelta(days=7)).date().isoformat()
-
     response = await client.process_query(
-        f"Use the get_availability tool to check available times for event type with ID '{event_type_id}' "
-        f"between {today} and {week_from_now}. "
-        f"If successful, start your response with 'Found available slots:' and list them. "
-        f"If no slots are found, start with 'No available slots found:'."
+        AVAILABILITY_PROMPT.format(
+            event_type_id=event_type_id,
+            start=date_window.today,
+            end=date_window.week_from_now,
+        )
     )
 
     assert response, "No response received from get_availability tool"
-    assert any(
-        ["Found available slots:" in response, "No available slots found:" in response]
+    assert (
+        "Found available slots:" in response or "No available slots found:" in response
     ), "Response must start with either 'Found available slots:' or 'No available slots found:'"
 
     if "Found available slots:" in response:
-        assert (
-            "available" in response.lower()
+        assert contains_ci(
+            response, "available"
         ), "Response should mention available slots"
     else:
-        assert (
-            "no available" in response.lower()
+        assert contains_ci(
+            response, "no available"
         ), "Response should indicate no available slots"
 
-    print("Availability results:")
-    print(f"\t{response}")
+    logger.debug("Availability results: %s", response)
 
     print("✅ Successfully retrieved availability")
 
 
 @pytest.mark.asyncio
-async def test_list_scheduled_events_tool(client):
+async def test_list_scheduled_events_tool(read_responses):
     """Test listing scheduled events"""
-    today = datetime.now().date().isoformat()
-    thirty_days_ago = (datetime.now() - timedelta(days=30)).date().isoformat()
-    thirty_days_from_now = (datetime.now() + timedelta(days=30)).date().isoformat()
-
-    response = await client.process_query(
-        f"Use the list_scheduled_events tool to list all active events "
-        f"between {thirty_days_ago} and {thirty_days_from_now}. "
-        f"If successful, start your response with 'Found scheduled events:' and list them. "
-        f"If no events are found, start with 'No scheduled events found:'."
-    )
+    response = query_response(read_responses, "list_scheduled_events")
 
     assert response, "No response received from list_scheduled_events tool"
-    assert any(
-        [
-            "Found scheduled events:" in response,
-            "No scheduled events found:" in response,
-        ]
+    assert (
+        "Found scheduled events:" in response
+        or "No scheduled events found:" in response
     ), "Response must start with either 'Found scheduled events:' or 'No scheduled events found:'"
 
     if "Found scheduled events:" in response:
-        assert "event" in response.lower(), "Response should mention events"
+        assert contains_ci(response, "event"), "Response should mention events"
     else:
-        assert (
-            "no events" in response.lower()
+        assert contains_ci(
+            response, "no events"
         ), "Response should indicate no events found"
 
-    print("Scheduled events:")
-    print(f"\t{response}")
+    logger.debug("Scheduled events: %s", response)
 
     print("✅ Successfully listed scheduled events")
 
 
 @pytest.mark.asyncio
-async def test_list_scheduled_events_with_filters(client):
+async def test_list_scheduled_events_with_filters(read_responses):
     """Test listing scheduled events with status filter"""
-    response = await client.process_query(
-        "Use the list_scheduled_events tool to list all canceled events from the last 60 days. "
-        "If successful, start your response with 'Found canceled events:' and list them. "
-        "If no canceled events are found, start with 'No canceled events found:'."
-    )
+    response = query_response(read_responses, "list_canceled_events")
 
     assert response, "No response received from list_scheduled_events tool"
-    assert any(
-        ["Found canceled events:" in response, "No canceled events found:" in response]
+    assert (
+        "Found canceled events:" in response or "No canceled events found:" in response
     ), "Response must start with either 'Found canceled events:' or 'No canceled events found:'"
 
     if "Found canceled events:" in response:
-        assert "canceled" in response.lower(), "Response should mention canceled events"
+        assert contains_ci(
+            response, "canceled"
+        ), "Response should mention canceled events"
     else:
-        assert (
-            "no canceled" in response.lower()
+        assert contains_ci(
+            response, "no canceled"
         ), "Response should indicate no canceled events found"
 
-    print("Canceled events:")
-    print(f"\t{response}")
+    logger.debug("Canceled events: %s", response)
 
     print("✅ Successfully listed canceled events")
 
 
 @pytest.mark.asyncio
-async def test_create_scheduling_link_tool(client):
+async def test_create_scheduling_link_tool(client, event_type_id):
     """Test creating a single-use scheduling link for an event type"""
-    response = await client.list_resources()
-    event_type_resource = next(
-        (
-            r
-            for r in response.resources
-            if str(r.uri).startswith("calendly://event_type/")
-        ),
-        None,
-    )
-
-    if not event_type_resource:
-        pytest.skip("No event type resources found - skipping test")
-
-    event_type_id = str(event_type_resource.uri).replace("calendly://event_type/", "")
-
     response = await client.process_query(
-        f"Use the create_scheduling_link tool to create a single-use link for event type ID '{event_type_id}'. "
-        f"If successful, start your response with 'Created scheduling link:' and include the link. "
-        f"If unsuccessful, start with 'Failed to create scheduling link:'."
+        SCHEDULING_LINK_PROMPT.format(event_type_id=event_type_id)
     )
 
     assert response, "No response received from create_scheduling_link tool"
-    assert any(
-        [
-            "Created scheduling link:" in response,
-            "Failed to create scheduling link:" in response,
-        ]
+    assert (
+        "Created scheduling link:" in response
+        or "Failed to create scheduling link:" in response
     ), "Response must start with either 'Created scheduling link:' or 'Failed to create scheduling link:'"
 
     if "Created scheduling link:" in response:
-        assert "link" in response.lower(), "Response should contain the scheduling link"
+        assert contains_ci(
+            response, "link"
+        ), "Response should contain the scheduling link"
     else:
-        assert "failed" in response.lower(), "Response should indicate failure"
+        assert contains_ci(response, "failed"), "Response should indicate failure"
 
-    print("Single-use scheduling link created:")
-    print(f"\t{response}")
+    logger.debug("Single-use scheduling link created: %s", response)
 
     print("✅ Successfully created single-use scheduling link")
 
 
 @pytest.mark.asyncio
+@pytest.mark.timeout(240)  # two LLM queries, listing then canceling
 async def test_cancel_event_flow(client):
     """Test the flow of finding and canceling an event (may be skipped if no active events)"""
     response = await client.process_query(
@@ -299,36 +319,24 @@ async def test_cancel_event_flow(client):
     if "No active events found:" in response:
         pytest.skip("No active events found - skipping cancel test")
 
-    lines = response.split("\n")
-    event_id = None
-    for line in lines:
-        if "ID:" in line:
-            event_id = line.split("ID:")[1].strip()
-            break
+    match = EVENT_ID_PATTERN.search(response)
+    event_id = match.group(1) if match else None
 
     if not event_id:
         pytest.fail("Could not extract event ID - test failed")
 
-    response = await client.process_query(
-        f"Use the cancel_event tool to cancel the event with ID '{event_id}' "
-        f"with reason 'Automated test cancellation - please ignore'. "
-        f"If successful, start your response with 'Successfully canceled event:' and include the event ID. "
-        f"If unsuccessful, start with 'Failed to cancel event:'."
-    )
+    response = await client.process_query(CANCEL_EVENT_PROMPT.format(event_id=event_id))
 
     assert response, "No response received from cancel_event tool"
-    assert any(
-        [
-            "Successfully canceled event:" in response,
-            "Failed to cancel event:" in response,
-        ]
+    assert (
+        "Successfully canceled event:" in response
+        or "Failed to cancel event:" in response
     ), "Response must start with either 'Successfully canceled event:' or 'Failed to cancel event:'"
 
     if "Successfully canceled event:" in response:
-        assert "canceled" in response.lower(), "Response should confirm cancellation"
+        assert contains_ci(response, "canceled"), "Response should confirm cancellation"
     else:
-        assert "failed" in response.lower(), "Response should indicate failure"
-    print("Event cancellation response:")
-    print(f"\t{response}")
+        assert contains_ci(response, "failed"), "Response should indicate failure"
+    logger.debug("Event cancellation response: %s", response)
 
     print("✅ Completed cancel event test")
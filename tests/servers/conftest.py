@@ -1,9 +1,13 @@
 import os
+import httpx
+import hashlib
 import pytest
 import asyncio
 import pytest_asyncio
 from typing import List
 
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
+
 from tests.clients.LocalMCPTestClient import LocalMCPTestClient
 from tests.clients.RemoteMCPTestClient import RemoteMCPTestClient
 
@@ -13,6 +17,43 @@ pytest_plugins = ["pytest_asyncio"]
 # Set asyncio default fixture loop scope to function
 def pytest_configure(config):
     config.option.asyncio_default_fixture_loop_scope = "function"
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run the marked tests on the same xdist worker"
+    )
+    config.addinivalue_line(
+        "markers",
+        "granular: per-step test also covered by a combined test, only run with --granular",
+    )
+    config.addinivalue_line(
+        "markers",
+        "concurrent_tools: runs a suite's TOOL_TESTS concurrently in one test, only run with --concurrent-tools",
+    )
+
+    # Don't write .pytest_cache (last-failed / new-first bookkeeping) on runs
+    # where it is thrown away afterwards, e.g. CI
+    if os.environ.get("PYTEST_SKIP_CACHE"):
+        if config.option.lf or config.option.failedfirst or config.option.newfirst:
+            raise pytest.UsageError(
+                "--lf, --ff and --nf need the last-failed / new-first bookkeeping "
+                "that PYTEST_SKIP_CACHE turns off; unset it to use them"
+            )
+        for name in ("lfplugin", "nfplugin"):
+            plugin = config.pluginmanager.get_plugin(name)
+            if plugin is not None:
+                config.pluginmanager.unregister(plugin)
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """Run the async tests on uvloop when it is installed
+
+    uvloop is optional (it doesn't support Windows); without it the tests
+    use asyncio's default event loop.
+    """
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
 
 
 def pytest_addoption(parser):
@@ -28,21 +69,125 @@ def pytest_addoption(parser):
         default=None,
         help="URL for the remote server endpoint (for remote tests)",
     )
+    parser.addoption(
+        "--cached-queries",
+        action="store_true",
+        help="Reuse process_query responses recorded in the pytest cache by earlier --cached-queries runs",
+    )
+    parser.addoption(
+        "--max-concurrent-queries",
+        action="store",
+        type=int,
+        default=4,
+        help="Maximum number of process_query calls a test client runs at once",
+    )
+    parser.addoption(
+        "--fresh-state",
+        action="store_true",
+        help="Ignore object IDs that earlier runs persisted in the pytest cache",
+    )
+    parser.addoption(
+        "--granular",
+        action="store_true",
+        help="Also run the per-step tests that a combined test covers in one query",
+    )
+    parser.addoption(
+        "--concurrent-tools",
+        action="store_true",
+        help="Also run the tests that run a suite's TOOL_TESTS concurrently in one test",
+    )
 
 
-def pytest_collection_modifyitems(items: List[pytest.Item]):
+def pytest_collection_modifyitems(config, items: List[pytest.Item]):
     """Mark tests to skip based on markers and command-line options"""
+    skip_granular = pytest.mark.skip(reason="per-step test, run with --granular")
+    skip_concurrent_tools = pytest.mark.skip(
+        reason="concurrent tool test driver, run with --concurrent-tools"
+    )
     for item in items:
-        if (
-            item.get_closest_marker("asyncio") is None
-            and "async def" in item.function.__code__.co_code
+        if item.get_closest_marker("granular") and not config.getoption("--granular"):
+            item.add_marker(skip_granular)
+        if item.get_closest_marker("concurrent_tools") and not config.getoption(
+            "--concurrent-tools"
         ):
-            item.add_marker(pytest.mark.asyncio)
+            item.add_marker(skip_concurrent_tools)
+
+        # A server's tests share one client and module-level context, so keep
+        # them on one worker under pytest-xdist's --dist loadgroup while
+        # different servers run in parallel
+        if item.get_closest_marker("xdist_group") is None:
+            item.add_marker(pytest.mark.xdist_group(item.path.parent.name))
+
+
+def _limit_process_query(client, limit: int):
+    """Cap how many process_query calls the client runs at once
+
+    The concurrent test helpers gather every independent query, so without
+    a cap a wide layer of tool tests bursts past the Anthropic and server
+    API rate limits and then stalls in 429 retry-after back-off.
+    """
+    semaphore = asyncio.Semaphore(limit)
+    process_query = client.process_query
+
+    async def limited_process_query(query: str) -> str:
+        async with semaphore:
+            return await process_query(query)
+
+    client.process_query = limited_process_query
+
+
+def _cache_process_query(client, cache, server_name: str):
+    """Serve repeated process_query prompts from the pytest cache
+
+    Responses are keyed on the server name and a hash of the prompt and
+    persisted with config.cache, so re-running a subset of tests (e.g. with
+    --lf) does not repeat LLM round-trips it already made. Set
+    LLM_CACHE_VERSION to a new value to stop reusing responses recorded
+    under the previous one (e.g. after changing the server's tools).
+    """
+    process_query = client.process_query
+    version = os.environ.get("LLM_CACHE_VERSION")
+    prefix = (
+        f"process_query/{server_name}/v{version}"
+        if version
+        else f"process_query/{server_name}"
+    )
+
+    async def cached_process_query(query: str) -> str:
+        digest = hashlib.sha256(query.encode()).hexdigest()
+        key = f"{prefix}/{digest}"
+        cached = cache.get(key, None)
+        if cached is not None:
+            return cached
 
+        response = await process_query(query)
+        cache.set(key, response)
+        return response
 
-@pytest_asyncio.fixture(scope="function")
-async def client(request):
-    """Fixture to provide a connected client for all tests"""
+    client.process_query = cached_process_query
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def anthropic_client():
+    """Anthropic client shared by every test client in the session
+
+    All LLM calls go through one pooled HTTP client, so connections to the
+    Anthropic API are kept alive across tests and test modules.
+    """
+    http_client = DefaultAsyncHttpxClient(
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+    )
+    async with AsyncAnthropic(http_client=http_client) as anthropic:
+        yield anthropic
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def client(request, anthropic_client):
+    """Fixture to provide a connected client shared by all tests in a module
+
+    The MCP transport is set up once per test module instead of once per test,
+    so the server subprocess / remote connection is reused across tests.
+    """
     # Get server name from test path
     test_path = request.node.fspath.strpath
     server_name = os.path.basename(os.path.dirname(test_path))
@@ -54,16 +199,28 @@ async def client(request):
             request.config.getoption("--endpoint")
             or f"http://localhost:8000/{server_name}/local"
         )
-        client = RemoteMCPTestClient()
+        client = RemoteMCPTestClient(anthropic=anthropic_client)
         await client.connect_to_server(endpoint)
         print(f"Connected to {server_name} at {endpoint}")
     else:
-        client = LocalMCPTestClient()
+        client = LocalMCPTestClient(anthropic=anthropic_client)
         await client.connect_to_server_by_name(server_name)
         print(f"Connected to {server_name}")
 
+    _limit_process_query(client, request.config.getoption("--max-concurrent-queries"))
+
+    cache = getattr(request.config, "cache", None)
+    if request.config.getoption("--cached-queries") and cache is not None:
+        _cache_process_query(client, cache, server_name)
+
     try:
         yield client
     finally:
         cleanup_task = asyncio.create_task(client.cleanup())
         await cleanup_task
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def resources(client):
+    """list_resources response of the module's server, fetched once per module"""
+    return await client.list_resources()
@@ -1,8 +1,15 @@
 import pytest
-import re
-import random
-import string
-from tests.utils.test_tools import get_test_id, run_tool_test, run_resources_test
+from tests.utils.test_tools import (
+    get_test_ids,
+    run_tool_test,
+    run_resources_test,
+    random_digits_setup,
+    compile_extractor,
+)
+
+# Extractors shared by several TOOL_TESTS entries, compiled once
+FILE_ID_PATTERN = compile_extractor(r'"?file_id"?[:\s]+([^,\s\n"]+)')
+NAME_PATTERN = compile_extractor(r'"name":\s*"([^"]+)"')
 
 
 TOOL_TESTS = [
@@ -14,7 +21,7 @@ TOOL_TESTS = [
             "created_file_id": r'"?created_file_id"?[:\s]+([^,\s\n"]+)'
         },
         "description": "create a new Excel workbook and return its ID",
-        "setup": lambda context: {"random_id": str(random.randint(10000, 99999))},
+        "setup": random_digits_setup,
     },
     # Basic file and workbook operations
     {
@@ -29,9 +36,9 @@ TOOL_TESTS = [
         "name": "add_worksheet",
         "args_template": 'with file_id="{created_file_id}" name="Test Worksheet-{random_id}"',
         "expected_keywords": ["name"],
-        "regex_extractors": {"new_worksheet_name": r'"name":\s*"([^"]+)"'},
+        "regex_extractors": {"new_worksheet_name": NAME_PATTERN},
         "description": "create a new worksheet in the Excel workbook and return the name of the worksheet",
-        "setup": lambda context: {"random_id": str(random.randint(10000, 99999))},
+        "setup": random_digits_setup,
         "depends_on": ["created_file_id"],
     },
     # Basic data operations - commented out as per user preference
@@ -39,7 +46,7 @@ TOOL_TESTS = [
         "name": "update_cells",
         "args_template": 'with file_id="{created_file_id}" worksheet_name="{new_worksheet_name}" range="A1:B3" values=[["Header 1", "Header 2"], ["Value 1", "Value 2"], ["Value 3", "Value 4"]]',
         "expected_keywords": ["file_id"],
-        "regex_extractors": {"file_id": r'"?file_id"?[:\s]+([^,\s\n"]+)'},
+        "regex_extractors": {"file_id": FILE_ID_PATTERN},
         "description": "update cell values in the worksheet and return the file_id",
         "depends_on": ["new_worksheet_name", "created_file_id"],
     },
@@ -47,7 +54,7 @@ TOOL_TESTS = [
         "name": "read_worksheet",
         "args_template": 'with file_id="{created_file_id}" worksheet_name="{new_worksheet_name}"',
         "expected_keywords": ["file_id"],
-        "regex_extractors": {"file_id": r'"?file_id"?[:\s]+([^,\s\n"]+)'},
+        "regex_extractors": {"file_id": FILE_ID_PATTERN},
         "description": "read data from the worksheet and return file_id",
         "depends_on": ["new_worksheet_name", "created_file_id"],
     },
@@ -55,7 +62,7 @@ TOOL_TESTS = [
         "name": "add_row",
         "args_template": 'with file_id="{created_file_id}" worksheet_name="{new_worksheet_name}" values=["New Value 1", "New Value 2"]',
         "expected_keywords": ["file_id"],
-        "regex_extractors": {"file_id": r'"?file_id"?[:\s]+([^,\s\n"]+)'},
+        "regex_extractors": {"file_id": FILE_ID_PATTERN},
         "description": "add a row to the end of the worksheet and return the file_id",
         "depends_on": ["new_worksheet_name", "created_file_id"],
     },
@@ -70,7 +77,7 @@ TOOL_TESTS = [
         "name": "add_formula",
         "args_template": 'with file_id="{created_file_id}" worksheet_name="{new_worksheet_name}" cell="C2" formula="=SUM(A2:B2)"',
         "expected_keywords": ["file_id"],
-        "regex_extractors": {"file_id": r'"?file_id"?[:\s]+([^,\s\n"]+)'},
+        "regex_extractors": {"file_id": FILE_ID_PATTERN},
         "description": "add a formula to a cell in the worksheet and return the file_id",
         "depends_on": ["new_worksheet_name", "created_file_id"],
     },
@@ -79,16 +86,16 @@ TOOL_TESTS = [
         "name": "add_table",
         "args_template": 'with file_id="{created_file_id}" worksheet_name="{new_worksheet_name}" range="D1:E3" name="TestTable-{random_id}"',
         "expected_keywords": ["table_name"],
-        "regex_extractors": {"table_name": r'"name":\s*"([^"]+)"'},
+        "regex_extractors": {"table_name": NAME_PATTERN},
         "description": "create a new table in the worksheet and return table_name",
         "depends_on": ["new_worksheet_name", "created_file_id"],
-        "setup": lambda context: {"random_id": str(random.randint(10000, 99999))},
+        "setup": random_digits_setup,
     },
     {
         "name": "list_tables",
         "args_template": 'with file_id="{created_file_id}"',
         "expected_keywords": ["table_name"],
-        "regex_extractors": {"table_name": r'"name":\s*"([^"]+)"'},
+        "regex_extractors": {"table_name": NAME_PATTERN},
         "description": "list all tables in the Excel workbook and return table_name",
         "depends_on": ["created_file_id"],
     },
@@ -112,7 +119,7 @@ TOOL_TESTS = [
         "expected_keywords": ["Successfully"],
         "description": "add a column to the table and return Successfully",
         "depends_on": ["new_worksheet_name", "table_name", "created_file_id"],
-        "setup": lambda context: {"random_id": str(random.randint(10000, 99999))},
+        "setup": random_digits_setup,
     },
     # Search and modify operations
     {
@@ -129,7 +136,7 @@ TOOL_TESTS = [
         "expected_keywords": ["created"],
         "description": "find a row by column value or create it if not found",
         "depends_on": ["new_worksheet_name", "created_file_id"],
-        "setup": lambda context: {"random_id": str(random.randint(10000, 99999))},
+        "setup": random_digits_setup,
     },
     {
         "name": "delete_worksheet_row",
@@ -170,7 +177,10 @@ async def test_resources(client):
     return await run_resources_test(client)
 
 
-@pytest.mark.parametrize("test_config", TOOL_TESTS, ids=get_test_id)
+TOOL_TEST_IDS = get_test_ids(TOOL_TESTS)
+
+
+@pytest.mark.parametrize("test_config", TOOL_TESTS, ids=TOOL_TEST_IDS)
 @pytest.mark.asyncio
 async def test_excel_tool(client, context, test_config):
     return await run_tool_test(client, context, test_config)
@@ -1,8 +1,5 @@
 import pytest
 import json
-import os
-import re
-import ast
 
 
 @pytest.mark.asyncio
@@ -1,6 +1,13 @@
 import pytest
 import uuid
-from tests.utils.test_tools import get_test_id, run_tool_test, run_resources_test
+from tests.utils.test_tools import (
+    count_tool_test_layers,
+    get_test_ids,
+    run_tool_test,
+    run_tool_tests_concurrently,
+    run_resources_test,
+    random_id_setup,
+)
 
 # Shared context dictionary at module level
 SHARED_CONTEXT = {}
@@ -19,7 +26,7 @@ TOOL_TESTS = [
         "expected_keywords": ["folder_id"],
         "regex_extractors": {"folder_id": r"folder_id:\s*([A-Za-z0-9_\-\.]+)"},
         "description": "Create a new test folder and return the id",
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "create_file_from_text",
@@ -28,7 +35,7 @@ TOOL_TESTS = [
         "regex_extractors": {"new_file_id": r"new_file_id:\s*([A-Za-z0-9_\-\.]+)"},
         "description": "Create a new text file in the test folder and return the id in format 'new_file_id: <id>'",
         "depends_on": ["folder_id"],
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "update_file_folder_name",
@@ -39,7 +46,7 @@ TOOL_TESTS = [
         },
         "description": "Rename the test file and return its id in format 'updated_file_id: <id>'",
         "depends_on": ["new_file_id"],
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "create_folder",
@@ -82,7 +89,7 @@ TOOL_TESTS = [
         "regex_extractors": {"copy_id": r"copy_id:\s*([A-Za-z0-9_\-\.]+)"},
         "description": "Create a copy of the test file and return its id in format 'copy_id: <id>'",
         "depends_on": ["file_id"],
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "add_file_sharing_preference",
@@ -99,7 +106,7 @@ TOOL_TESTS = [
         "regex_extractors": {"shortcut_id": r"shortcut_id:\s*([A-Za-z0-9_\-\.]+)"},
         "description": "Create a shortcut to the test file and return its id in format 'shortcut_id: <id>'",
         "depends_on": ["file_id", "folder_id"],
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "delete_file",
@@ -119,7 +126,26 @@ def context():
     return SHARED_CONTEXT
 
 
-@pytest.mark.parametrize("test_config", TOOL_TESTS, ids=get_test_id)
+TOOL_TEST_IDS = get_test_ids(TOOL_TESTS)
+
+
+# Each dependency layer gets the default 120 s per-test budget
+@pytest.mark.concurrent_tools
+@pytest.mark.timeout(120 * count_tool_test_layers(TOOL_TESTS))
+@pytest.mark.asyncio
+async def test_gdrive_tools(client):
+    """Run every tool test, with independent ones running concurrently.
+
+    The tests run in dependency order (e.g. the file is created after its
+    folder and moved after its subfolder), while independent ones like
+    search / create_folder / retrieve_files share one round-trip. Covers
+    the same tests as test_gdrive_tool in less wall-clock time, but reports
+    them as one result, so it only runs with --concurrent-tools.
+    """
+    return await run_tool_tests_concurrently(client, dict(SHARED_CONTEXT), TOOL_TESTS)
+
+
+@pytest.mark.parametrize("test_config", TOOL_TESTS, ids=TOOL_TEST_IDS)
 @pytest.mark.asyncio
 async def test_gdrive_tool(client, context, test_config):
     return await run_tool_test(client, context, test_config)
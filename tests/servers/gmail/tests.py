@@ -1,13 +1,18 @@
 import pytest
-import uuid
 
-from tests.utils.test_tools import get_test_id, run_tool_test
+from tests.utils.test_tools import (
+    count_tool_test_layers,
+    get_test_ids,
+    run_tool_test,
+    run_tool_tests_concurrently,
+    random_id_setup,
+)
 
 
 @pytest.mark.asyncio
-async def test_list_resources(client):
+async def test_list_resources(resources):
     """Test listing Gmail labels"""
-    response = await client.list_resources()
+    response = resources
     assert (
         response and hasattr(response, "resources") and len(response.resources)
     ), f"Invalid list resources response: {response}"
@@ -20,10 +25,10 @@ async def test_list_resources(client):
 
 
 @pytest.mark.asyncio
-async def test_read_label(client):
+async def test_read_label(client, resources):
     """Test reading emails from a label"""
-    # First list labels to get a valid label ID
-    response = await client.list_resources()
+    # Use the module's label listing to get a valid label ID
+    response = resources
     assert (
         response and hasattr(response, "resources") and len(response.resources)
     ), f"Invalid list resources response: {response}"
@@ -68,7 +73,7 @@ TOOL_TESTS = [
         "expected_keywords": ["label_id"],
         "regex_extractors": {"label_id": r"label_id:\s*([A-Za-z0-9_]+)"},
         "description": "create a label and return label id",
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "create_draft",
@@ -111,6 +116,7 @@ TOOL_TESTS = [
         },
         "description": "unstar an email and return unstarred email thread id in format unstarred_email_id: <unstarred_email_id>",
         "depends_on": ["email_thread_id"],
+        "run_after": ["star_email"],
     },
     {
         "name": "forward_email",
@@ -150,6 +156,13 @@ TOOL_TESTS = [
         "regex_extractors": {"archived_email_id": r"archived_email_id:\s*([a-z0-9]+)"},
         "description": "archive an email and return archived email id in format archived_email_id: <archived_email_id>",
         "depends_on": ["email_thread_id"],
+        "run_after": [
+            "update_email",
+            "unstar_email",
+            "forward_email",
+            "get_attachment_details",
+            "download_attachment",
+        ],
     },
     {
         "name": "trash_email",
@@ -158,6 +171,7 @@ TOOL_TESTS = [
         "regex_extractors": {"trashed_email_id": r"trashed_email_id:\s*([a-z0-9]+)"},
         "description": "trash an email and return trashed email id in format trashed_email_id: <trashed_email_id>",
         "depends_on": ["email_thread_id"],
+        "run_after": ["archive_email"],
     },
 ]
 
@@ -167,7 +181,25 @@ def context():
     return SHARED_CONTEXT
 
 
-@pytest.mark.parametrize("test_config", TOOL_TESTS, ids=get_test_id)
+TOOL_TEST_IDS = get_test_ids(TOOL_TESTS)
+
+
+# Each dependency layer gets the default 120 s per-test budget
+@pytest.mark.concurrent_tools
+@pytest.mark.timeout(120 * count_tool_test_layers(TOOL_TESTS))
+@pytest.mark.asyncio
+async def test_gmail_tools(client):
+    """Run every tool test, with independent ones running concurrently.
+
+    read_emails, create_label, create_draft and send_email go out together,
+    then the operations on the sent email, ending with archive and trash.
+    Covers the same tests as test_gmail_tool in less wall-clock time, but
+    reports them as one result, so it only runs with --concurrent-tools.
+    """
+    return await run_tool_tests_concurrently(client, dict(SHARED_CONTEXT), TOOL_TESTS)
+
+
+@pytest.mark.parametrize("test_config", TOOL_TESTS, ids=TOOL_TEST_IDS)
 @pytest.mark.asyncio
 async def test_gmail_tool(client, context, test_config):
     return await run_tool_test(client, context, test_config)
@@ -1,6 +1,10 @@
 import pytest
-import uuid
-from tests.utils.test_tools import get_test_id, run_tool_test, run_resources_test
+from tests.utils.test_tools import (
+    get_test_ids,
+    run_tool_test,
+    run_resources_test,
+    random_id_setup,
+)
 
 
 # Shared context dictionary at module level
@@ -13,7 +17,7 @@ TOOL_TESTS = [
         "expected_keywords": ["created_sheet_id"],
         "regex_extractors": {"created_sheet_id": r"created_sheet_id:\s*([^\s]+)"},
         "description": "create a new Google Sheet and extract its ID",
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "get-spreadsheet-info",
@@ -94,7 +98,10 @@ async def test_resources(client, context):
     return response
 
 
-@pytest.mark.parametrize("test_config", TOOL_TESTS, ids=get_test_id)
+TOOL_TEST_IDS = get_test_ids(TOOL_TESTS)
+
+
+@pytest.mark.parametrize("test_config", TOOL_TESTS, ids=TOOL_TEST_IDS)
 @pytest.mark.asyncio
 async def test_tool(client, context, test_config):
     """Test Google Sheets tools"""
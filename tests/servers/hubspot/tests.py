@@ -1,9 +1,12 @@
 import uuid
 import pytest
 import time
-import random
-from tests.utils.test_tools import get_test_id, run_tool_test, run_resources_test
-
+from tests.utils.test_tools import (
+    get_test_ids,
+    run_tool_test,
+    run_resources_test,
+    random_id_setup,
+)
 
 # Shared context dictionary at module level
 SHARED_CONTEXT = {}
@@ -22,7 +25,7 @@ TOOL_TESTS = [
         "expected_keywords": ["created_contact_id"],
         "regex_extractors": {"created_contact_id": r"created_contact_id:\s*(\d+)"},
         "description": "create a new HubSpot contact and return its created_contact_id",
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "update_contact",
@@ -31,7 +34,7 @@ TOOL_TESTS = [
         "regex_extractors": {"updated_contact_id": r"updated_contact_id:\s*(\d+)"},
         "description": "update an existing HubSpot contact",
         "depends_on": ["created_contact_id"],
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "search_contacts",
@@ -53,7 +56,7 @@ TOOL_TESTS = [
         "expected_keywords": ["created_company_id"],
         "regex_extractors": {"created_company_id": r"created_company_id:\s*(\d+)"},
         "description": "create a new HubSpot company and return its ID",
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "update_company",
@@ -62,7 +65,7 @@ TOOL_TESTS = [
         "regex_extractors": {"updated_company_id": r"updated_company_id:\s*(\d+)"},
         "description": "update an existing HubSpot company",
         "depends_on": ["created_company_id"],
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "list_deals",
@@ -77,7 +80,7 @@ TOOL_TESTS = [
         "expected_keywords": ["created_deal_id"],
         "regex_extractors": {"created_deal_id": r"created_deal_id:\s*(\d+)"},
         "description": "create a new HubSpot deal and return its ID",
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "update_deal",
@@ -100,7 +103,7 @@ TOOL_TESTS = [
         "expected_keywords": ["_status_code"],
         "description": "send an email to a HubSpot contact",
         "depends_on": ["created_contact_id"],
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "create_ticket",
@@ -108,7 +111,7 @@ TOOL_TESTS = [
         "expected_keywords": ["created_ticket_id"],
         "regex_extractors": {"created_ticket_id": r"created_ticket_id:\s*(\d+)"},
         "description": "create a new HubSpot ticket",
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "list_tickets",
@@ -132,7 +135,7 @@ TOOL_TESTS = [
         "regex_extractors": {"updated_ticket_id": r"updated_ticket_id:\s*(\d+)"},
         "description": "update an existing HubSpot ticket",
         "depends_on": ["created_ticket_id"],
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "create_ticket",
@@ -140,7 +143,7 @@ TOOL_TESTS = [
         "expected_keywords": ["duplicate_ticket_id"],
         "regex_extractors": {"duplicate_ticket_id": r"duplicate_ticket_id:\s*(\d+)"},
         "description": "create a duplicate ticket with subject, content, and hs_pipeline_stage parameters for testing merge",
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "merge_tickets",
@@ -169,7 +172,7 @@ TOOL_TESTS = [
         "expected_keywords": ["created_product_id"],
         "regex_extractors": {"created_product_id": r"created_product_id:\s*(\d+)"},
         "description": "create a new HubSpot product and return its ID",
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "get_product",
@@ -186,7 +189,7 @@ TOOL_TESTS = [
         "regex_extractors": {"updated_product_id": r"updated_product_id:\s*(\d+)"},
         "description": "update an existing HubSpot product",
         "depends_on": ["created_product_id"],
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "delete_product",
@@ -238,7 +241,7 @@ TOOL_TESTS = [
         },
         "description": "update an existing HubSpot engagement",
         "depends_on": ["created_engagement_id"],
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "delete_engagement",
@@ -253,6 +256,7 @@ TOOL_TESTS = [
         "expected_keywords": ["secondary_contact_id"],
         "regex_extractors": {"secondary_contact_id": r"secondary_contact_id:\s*(\d+)"},
         "description": "create a second hubspot contact and return its secondary_contact_id",
+        "setup": random_id_setup,
     },
     {
         "name": "merge_contacts",
@@ -276,7 +280,10 @@ def context():
     return SHARED_CONTEXT
 
 
-@pytest.mark.parametrize("test_config", TOOL_TESTS, ids=get_test_id)
+TOOL_TEST_IDS = get_test_ids(TOOL_TESTS)
+
+
+@pytest.mark.parametrize("test_config", TOOL_TESTS, ids=TOOL_TEST_IDS)
 @pytest.mark.asyncio
 async def test_hubspot_tool(client, context, test_config):
     return await run_tool_test(client, context, test_config)
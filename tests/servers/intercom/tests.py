@@ -1,6 +1,6 @@
 import pytest
 import re
-import time
+import uuid
 
 
 @pytest.mark.asyncio
@@ -76,7 +76,7 @@ async def test_search_contacts(client):
 @pytest.mark.asyncio
 async def test_create_contact(client):
     """Test creating a contact"""
-    unique_email = f"test_user_{int(time.time())}@example.com"
+    unique_email = f"test_user_{uuid.uuid4().hex[:8]}@example.com"
 
     response = await client.process_query(
         f"Use the create_contact tool to create a new contact with email '{unique_email}' and name 'Test User'. "
@@ -125,7 +125,7 @@ async def test_search_companies(client):
 @pytest.mark.asyncio
 async def test_create_company(client):
     """Test creating a company"""
-    unique_name = f"Test Company {int(time.time())}"
+    unique_name = f"Test Company {uuid.uuid4().hex[:8]}"
 
     response = await client.process_query(
         f"Use the create_company tool to create a new company with name '{unique_name}' and random company id"
@@ -142,7 +142,7 @@ async def test_create_company(client):
 @pytest.mark.asyncio
 async def test_conversation_workflow(client):
     """Test full conversation workflow - create, reply, tag, note"""
-    unique_email = f"convo_test_{int(time.time())}@example.com"
+    unique_email = f"convo_test_{uuid.uuid4().hex[:8]}@example.com"
 
     contact_response = await client.process_query(
         f"Use the create_contact tool to create a new contact with email '{unique_email}' and name 'Conversation Test User' and role as user. "
@@ -181,7 +181,7 @@ async def test_conversation_workflow(client):
 @pytest.mark.asyncio
 async def test_ticket_workflow(client):
     """Test ticket workflow - create, update, comment"""
-    unique_email = f"ticket_test_{int(time.time())}@example.com"
+    unique_email = f"ticket_test_{uuid.uuid4().hex[:8]}@example.com"
 
     # First create a contact
     contact_response = await client.process_query(
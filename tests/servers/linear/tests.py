@@ -1,11 +1,16 @@
 import re
 import pytest
+import pytest_asyncio
+from tests.utils.test_tools import check_response
+
+TEAM_URI_PREFIX = "linear://team/"
+ISSUE_ID_PATTERN = re.compile(r"ISSUE_ID:([a-zA-Z0-9-]+)")
 
 
 @pytest.mark.asyncio
-async def test_list_resources(client):
+async def test_list_resources(resources):
     """Test listing teams and issues from Linear"""
-    response = await client.list_resources()
+    response = resources
     assert (
         response and hasattr(response, "resources") and len(response.resources)
     ), f"Invalid list resources response: {response}"
@@ -18,17 +23,17 @@ async def test_list_resources(client):
 
 
 @pytest.mark.asyncio
-async def test_read_team(client):
+async def test_read_team(client, resources):
     """Test reading a team resource"""
-    # First list resources to get a valid team ID
-    response = await client.list_resources()
+    # Use the module's resource listing to get a valid team ID
+    response = resources
     assert (
         response and hasattr(response, "resources") and len(response.resources)
     ), f"Invalid list resources response: {response}"
 
     # Find first team resource
     team_resource = next(
-        (r for r in response.resources if str(r.uri).startswith("linear://team/")),
+        (r for r in response.resources if str(r.uri).startswith(TEAM_URI_PREFIX)),
         None,
     )
     assert team_resource, "No team resources found"
@@ -53,54 +58,53 @@ async def test_search_issues(client):
         "Use the search_issues tool to search for all issues. If you find any issues, start your response with 'Found issues:' and then list them."
     )
 
-    # Verify search results
-    assert (
-        "found issues:" in response.lower()
-    ), f"Search results should start with 'Found issues:': {response}"
-
-    print("Search results:")
-    print(f"\t{response}")
-    print("✅ Search functionality working")
+    check_response(response, "found issues:", "search_issues")
 
 
-@pytest.mark.asyncio
-async def test_create_issue(client):
-    """Test creating an issue"""
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def create_issue_response(client, resources):
+    """Response of creating one test issue, shared by the tests that need an issue"""
     # First get a valid team ID
-    response = await client.list_resources()
     team_resource = next(
-        (r for r in response.resources if str(r.uri).startswith("linear://team/")),
+        (r for r in resources.resources if str(r.uri).startswith(TEAM_URI_PREFIX)),
         None,
     )
     assert team_resource, "No team resources found"
-    team_id = str(team_resource.uri).replace("linear://team/", "")
+    team_id = str(team_resource.uri)[len(TEAM_URI_PREFIX) :]
 
     # Create test issue with a marker for easy ID extraction
-    create_response = await client.process_query(
+    return await client.process_query(
         f"Use the create_issue tool to create an issue with team_id '{team_id}', "
         "title 'Test Issue', description 'This is a test issue.', and priority 4. "
         "After creating the issue, output the ID in this exact format: 'ISSUE_ID:your-issue-id-here'"
     )
 
+
+@pytest.fixture(scope="module")
+def issue_id(create_issue_response):
+    """ID of the module's test issue, skipping the test if creating it returned none"""
+    issue_id_match = ISSUE_ID_PATTERN.search(create_issue_response)
+    if not issue_id_match:
+        pytest.skip("Issue creation did not return an issue ID")
+    return issue_id_match.group(1)
+
+
+@pytest.mark.asyncio
+async def test_create_issue(create_issue_response):
+    """Test creating an issue"""
     print("Create issue response:")
-    print(f"\t{create_response}")
+    print(f"\t{create_issue_response}")
     print("✅ Issue creation working")
 
     # Extract issue ID from the response using the marker
-    issue_id_match = re.search(r"ISSUE_ID:([a-zA-Z0-9-]+)", create_response)
-    assert issue_id_match, f"Could not find issue ID in the response: {create_response}"
-    issue_id = issue_id_match.group(1)
-
-    return issue_id
+    assert ISSUE_ID_PATTERN.search(
+        create_issue_response
+    ), f"Could not find issue ID in the response: {create_issue_response}"
 
 
 @pytest.mark.asyncio
-async def test_update_issue(client):
+async def test_update_issue(client, issue_id):
     """Test updating an issue"""
-    # First create an issue and get its ID
-    issue_id = await test_create_issue(client)
-    assert issue_id, "Failed to get issue ID from creation"
-
     # Update test issue
     update_response = await client.process_query(
         f"Use the update_issue tool to update the issue with issue_id '{issue_id}', "
@@ -3,10 +3,20 @@ import os
 import uuid
 import tempfile
 
-# Global variables to store created test file paths
-local_test_file_path = None
-remote_test_folder_name = None
-remote_test_file_name = None
+
+@pytest.fixture(scope="module")
+def context():
+    """Names and paths created by the tests, shared across the module.
+
+    Removes the local test file once the module's tests are done.
+    """
+    context = {}
+    yield context
+
+    local_test_file_path = context.get("local_test_file_path")
+    if local_test_file_path and os.path.exists(local_test_file_path):
+        os.remove(local_test_file_path)
+        print(f"Cleaned up local test file: {local_test_file_path}")
 
 
 def create_test_file(content="Test content"):
@@ -41,16 +51,16 @@ async def test_list_files(client):
 
 
 @pytest.mark.asyncio
-async def test_create_folder(client):
+async def test_create_folder(client, context):
     """Test creating a folder in OneDrive.
 
     Args:
         client: The test client fixture for the MCP server.
+        context: Names and paths created by earlier tests in the module.
     """
-    global remote_test_folder_name
-
     folder_path = "/"
     remote_test_folder_name = f"TestFolder_{str(uuid.uuid4())[:8]}"
+    context["remote_test_folder_name"] = remote_test_folder_name
 
     response = await client.process_query(
         f"Use the create_folder tool to create a new folder at path '{folder_path}' with the name '{remote_test_folder_name}'. "
@@ -69,19 +79,22 @@ async def test_create_folder(client):
 
 
 @pytest.mark.asyncio
-async def test_upload_file(client):
+async def test_upload_file(client, context):
     """Test uploading a file to OneDrive.
 
     Args:
         client: The test client fixture for the MCP server.
+        context: Names and paths created by earlier tests in the module.
     """
-    global local_test_file_path, remote_test_file_name
+    remote_test_folder_name = context.get("remote_test_folder_name")
 
     # Create a local test file
     local_test_file_path = create_test_file(
         f"OneDrive Test File Content {uuid.uuid4()}"
     )
+    context["local_test_file_path"] = local_test_file_path
     remote_test_file_name = f"TestFile_{str(uuid.uuid4())[:8]}.txt"
+    context["remote_test_file_name"] = remote_test_file_name
     destination_path = f"/{remote_test_folder_name}/{remote_test_file_name}"
 
     response = await client.process_query(
@@ -103,12 +116,14 @@ async def test_upload_file(client):
 
 
 @pytest.mark.asyncio
-async def test_search_files(client):
+async def test_search_files(client, context):
     """Test searching for files in OneDrive.
 
     Args:
         client: The test client fixture for the MCP server.
+        context: Names and paths created by earlier tests in the module.
     """
+    remote_test_file_name = context.get("remote_test_file_name")
     if not remote_test_file_name:
         pytest.skip("No file uploaded - run upload_file test first")
 
@@ -132,12 +147,15 @@ async def test_search_files(client):
 
 
 @pytest.mark.asyncio
-async def test_get_file_sharing_link(client):
+async def test_get_file_sharing_link(client, context):
     """Test getting a sharing link for a file in OneDrive.
 
     Args:
         client: The test client fixture for the MCP server.
+        context: Names and paths created by earlier tests in the module.
     """
+    remote_test_folder_name = context.get("remote_test_folder_name")
+    remote_test_file_name = context.get("remote_test_file_name")
     if not remote_test_folder_name or not remote_test_file_name:
         pytest.skip("No file uploaded - run upload_file test first")
 
@@ -155,12 +173,15 @@ async def test_get_file_sharing_link(client):
 
 
 @pytest.mark.asyncio
-async def test_download_file(client):
+async def test_download_file(client, context):
     """Test downloading a file from OneDrive.
 
     Args:
         client: The test client fixture for the MCP server.
+        context: Names and paths created by earlier tests in the module.
     """
+    remote_test_folder_name = context.get("remote_test_folder_name")
+    remote_test_file_name = context.get("remote_test_file_name")
     if not remote_test_folder_name or not remote_test_file_name:
         pytest.skip("No file uploaded - run upload_file test first")
 
@@ -193,12 +214,15 @@ async def test_download_file(client):
 
 
 @pytest.mark.asyncio
-async def test_delete_item_file(client):
+async def test_delete_item_file(client, context):
     """Test deleting a file from OneDrive.
 
     Args:
         client: The test client fixture for the MCP server.
+        context: Names and paths created by earlier tests in the module.
     """
+    remote_test_folder_name = context.get("remote_test_folder_name")
+    remote_test_file_name = context.get("remote_test_file_name")
     if not remote_test_folder_name or not remote_test_file_name:
         pytest.skip("No file uploaded - run upload_file test first")
 
@@ -223,12 +247,14 @@ async def test_delete_item_file(client):
 
 
 @pytest.mark.asyncio
-async def test_delete_item_folder(client):
+async def test_delete_item_folder(client, context):
     """Test deleting a folder from OneDrive.
 
     Args:
         client: The test client fixture for the MCP server.
+        context: Names and paths created by earlier tests in the module.
     """
+    remote_test_folder_name = context.get("remote_test_folder_name")
     if not remote_test_folder_name:
         pytest.skip("No folder created - run create_folder test first")
 
@@ -250,10 +276,3 @@ async def test_delete_item_folder(client):
 
     print(f"Response: {response}")
     print("✅ delete_item_folder passed.")
-
-
-def teardown_module(module):
-    """Clean up any remaining test files after all tests are run."""
-    if local_test_file_path and os.path.exists(local_test_file_path):
-        os.remove(local_test_file_path)
-        print(f"Cleaned up local test file: {local_test_file_path}")
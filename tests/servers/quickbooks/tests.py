@@ -1,10 +1,35 @@
 import pytest
+import pytest_asyncio
+
+from tests.utils.test_tools import (
+    find_first_resources,
+    query_response,
+    read_first_resources,
+)
+
+# URI prefix of each resource kind the read tests cover
+RESOURCE_URI_PREFIXES = {
+    "customer": "quickbooks://customer/",
+    "invoice": "quickbooks://invoice/",
+    "account": "quickbooks://account/",
+}
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def first_resource_contents(client, resources):
+    """read_resource responses of the first customer, invoice and account, read concurrently.
+
+    Maps each kind to the response, to the error reading it raised, or to
+    None if the server listed no resource of that kind.
+    """
+    first = find_first_resources(resources, RESOURCE_URI_PREFIXES)
+    return await read_first_resources(client, first)
 
 
 @pytest.mark.asyncio
-async def test_list_resources(client):
+async def test_list_resources(resources):
     """Test listing resources from QuickBooks"""
-    response = await client.list_resources()
+    response = resources
     assert (
         response and hasattr(response, "resources") and len(response.resources)
     ), f"Invalid list resources response: {response}"
@@ -17,30 +42,13 @@ async def test_list_resources(client):
 
 
 @pytest.mark.asyncio
-async def test_read_customer(client):
+async def test_read_customer(first_resource_contents):
     """Test reading a customer resource"""
-    # First list resources to get a valid customer ID
-    response = await client.list_resources()
-    assert (
-        response and hasattr(response, "resources") and len(response.resources)
-    ), f"Invalid list resources response: {response}"
-
-    # Find first customer resource
-    customer_resource = next(
-        (
-            r
-            for r in response.resources
-            if str(r.uri).startswith("quickbooks://customer/")
-        ),
-        None,
-    )
-
     # Skip test if no customer resources found
-    if not customer_resource:
+    if first_resource_contents["customer"] is None:
         pytest.skip("No customer resources found")
 
-    # Read customer details
-    response = await client.read_resource(customer_resource.uri)
+    response = query_response(first_resource_contents, "customer")
     assert response.contents, "Response should contain customer data"
     assert response.contents[0].mimeType == "application/json", "Expected JSON response"
 
@@ -50,30 +58,13 @@ async def test_read_customer(client):
 
 
 @pytest.mark.asyncio
-async def test_read_invoice(client):
+async def test_read_invoice(first_resource_contents):
     """Test reading an invoice resource"""
-    # First list resources to get a valid invoice ID
-    response = await client.list_resources()
-    assert (
-        response and hasattr(response, "resources") and len(response.resources)
-    ), f"Invalid list resources response: {response}"
-
-    # Find first invoice resource
-    invoice_resource = next(
-        (
-            r
-            for r in response.resources
-            if str(r.uri).startswith("quickbooks://invoice/")
-        ),
-        None,
-    )
-
     # Skip test if no invoice resources found
-    if not invoice_resource:
+    if first_resource_contents["invoice"] is None:
         pytest.skip("No invoice resources found")
 
-    # Read invoice details
-    response = await client.read_resource(invoice_resource.uri)
+    response = query_response(first_resource_contents, "invoice")
     assert response.contents, "Response should contain invoice data"
     assert response.contents[0].mimeType == "application/json", "Expected JSON response"
 
@@ -83,30 +74,13 @@ async def test_read_invoice(client):
 
 
 @pytest.mark.asyncio
-async def test_read_account(client):
+async def test_read_account(first_resource_contents):
     """Test reading an account resource"""
-    # First list resources to get a valid account ID
-    response = await client.list_resources()
-    assert (
-        response and hasattr(response, "resources") and len(response.resources)
-    ), f"Invalid list resources response: {response}"
-
-    # Find first account resource
-    account_resource = next(
-        (
-            r
-            for r in response.resources
-            if str(r.uri).startswith("quickbooks://account/")
-        ),
-        None,
-    )
-
     # Skip test if no account resources found
-    if not account_resource:
+    if first_resource_contents["account"] is None:
         pytest.skip("No account resources found")
 
-    # Read account details
-    response = await client.read_resource(account_resource.uri)
+    response = query_response(first_resource_contents, "account")
     assert response.contents, "Response should contain account data"
     assert response.contents[0].mimeType == "application/json", "Expected JSON response"
 
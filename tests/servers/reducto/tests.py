@@ -2,7 +2,6 @@ import pytest
 import json
 import os
 import tempfile
-from pathlib import Path
 
 
 @pytest.mark.asyncio
@@ -1,7 +1,6 @@
 import pytest
-import uuid
 
-from tests.utils.test_tools import get_test_id, run_tool_test
+from tests.utils.test_tools import get_test_ids, run_tool_test, random_id_setup
 
 
 # Shared context dictionary for test values
@@ -34,7 +33,7 @@ TOOL_TESTS = [
         "expected_keywords": ["account_id"],
         "regex_extractors": {"account_id": r"account_id:\s*([A-Za-z0-9]{15,18})"},
         "description": "Create a new Account record",
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "get_record",
@@ -59,7 +58,7 @@ TOOL_TESTS = [
         "regex_extractors": {"contact_id": r"contact_id:\s*([A-Za-z0-9]{15,18})"},
         "description": "Create a new Contact record related to the test Account",
         "depends_on": ["account_id"],
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "update_record",
@@ -68,7 +67,7 @@ TOOL_TESTS = [
         "regex_extractors": {"record_id": r"record_id:\s*([^\s]+)"},
         "description": "Update an existing Account record and return the record_id",
         "depends_on": ["account_id"],
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "list_campaigns",
@@ -92,7 +91,7 @@ TOOL_TESTS = [
         "regex_extractors": {"child_id": r"child_id:\s*([A-Za-z0-9]{15,18})"},
         "description": "Create child records from line items and sets the parent-child relationship",
         "depends_on": ["account_id"],
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "find_child_records",
@@ -108,7 +107,7 @@ TOOL_TESTS = [
         "expected_keywords": ["note_id"],
         "regex_extractors": {"note_id": r"note_id:\s*([A-Za-z0-9]{15,18})"},
         "description": "Create an enhanced note (ContentNote)",
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "create_file",
@@ -116,7 +115,7 @@ TOOL_TESTS = [
         "expected_keywords": ["file_id"],
         "regex_extractors": {"file_id": r"file_id:\s*([A-Za-z0-9]{15,18})"},
         "description": "Create a file (ContentVersion)",
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "create_record",
@@ -124,7 +123,7 @@ TOOL_TESTS = [
         "expected_keywords": ["lead_id"],
         "regex_extractors": {"lead_id": r"lead_id:\s*([A-Za-z0-9]{15,18})"},
         "description": "Create a new Lead record",
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "add_lead_to_campaign",
@@ -141,7 +140,7 @@ TOOL_TESTS = [
         "regex_extractors": {"success": r"success:\s*(true|false)"},
         "description": "Convert a lead to account, contact, and opportunity",
         "depends_on": ["lead_id"],
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "create_note",
@@ -150,7 +149,7 @@ TOOL_TESTS = [
         "regex_extractors": {"note_id": r"note_id:\s*([A-Za-z0-9]{15,18})"},
         "description": "Create a legacy note linked to a parent record",
         "depends_on": ["account_id"],
-        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+        "setup": random_id_setup,
     },
     {
         "name": "list_email_templates",
@@ -185,7 +184,10 @@ def context():
     return SHARED_CONTEXT
 
 
-@pytest.mark.parametrize("test_config", TOOL_TESTS, ids=get_test_id)
+TOOL_TEST_IDS = get_test_ids(TOOL_TESTS)
+
+
+@pytest.mark.parametrize("test_config", TOOL_TESTS, ids=TOOL_TEST_IDS)
 @pytest.mark.asyncio
 async def test_salesforce_tool(client, context, test_config):
     return await run_tool_test(client, context, test_config)
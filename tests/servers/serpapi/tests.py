@@ -1,6 +1,5 @@
 import pytest
 import re
-import json
 
 
 @pytest.mark.asyncio
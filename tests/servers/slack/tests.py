@@ -1,7 +1,15 @@
 import pytest
 import random
 import string
-from tests.utils.test_tools import get_test_id, run_tool_test, run_resources_test
+from tests.utils.test_tools import (
+    get_test_ids,
+    run_tool_test,
+    run_resources_test,
+    compile_extractor,
+)
+
+# Extractor of the ok flag most Slack tools report, compiled once
+OK_PATTERN = compile_extractor(r"ok:\s*(true|yes)")
 
 
 def random_id():
@@ -30,7 +38,7 @@ TOOL_TESTS = [
         "args_template": "to channel with ID {channel_id} users {test_user_id}",
         "expected_keywords": ["ok"],
         "regex_extractors": {
-            "ok": r"ok:\s*(true|yes)",
+            "ok": OK_PATTERN,
         },
         "description": "Invite user to the channel and return ok parameter from the response",
         "depends_on": ["channel_id", "test_user_id"],
@@ -94,7 +102,7 @@ TOOL_TESTS = [
         "args_template": 'in channel with ID {channel_id} with timestamp "{message_ts}"',
         "expected_keywords": ["ok"],
         "regex_extractors": {
-            "ok": r"ok:\s*(true|yes)",
+            "ok": OK_PATTERN,
         },
         "description": "Pin a message in the channel and return ok parameter from the response",
         "depends_on": ["channel_id", "message_ts"],
@@ -136,7 +144,7 @@ TOOL_TESTS = [
         "args_template": 'in channel with ID {channel_id} with timestamp "{message_ts}"',
         "expected_keywords": ["ok"],
         "regex_extractors": {
-            "ok": r"ok:\s*(true|yes)",
+            "ok": OK_PATTERN,
         },
         "description": "Unpin a message from the channel and return ok parameter from the response",
         "depends_on": ["channel_id", "message_ts"],
@@ -156,7 +164,7 @@ TOOL_TESTS = [
         "args_template": "with channel {channel_id} and user {test_user_id}",
         "expected_keywords": ["ok"],
         "regex_extractors": {
-            "ok": r"ok:\s*(true|yes)",
+            "ok": OK_PATTERN,
         },
         "description": "Remove a user from the channel and return ok parameter from the response",
         "depends_on": ["channel_id", "test_user_id"],
@@ -167,7 +175,7 @@ TOOL_TESTS = [
         "args_template": "channel with ID {channel_id}",
         "expected_keywords": ["ok"],
         "regex_extractors": {
-            "ok": r"ok:\s*(true|yes)",
+            "ok": OK_PATTERN,
         },
         "description": "Archive the created channel and return ok parameter from the response",
         "depends_on": ["channel_id"],
@@ -197,7 +205,10 @@ async def test_resources(client, context):
     return response
 
 
-@pytest.mark.parametrize("test_config", TOOL_TESTS, ids=get_test_id)
+TOOL_TEST_IDS = get_test_ids(TOOL_TESTS)
+
+
+@pytest.mark.parametrize("test_config", TOOL_TESTS, ids=TOOL_TEST_IDS)
 @pytest.mark.asyncio
 async def test_slack_tool(client, context, test_config):
     return await run_tool_test(client, context, test_config)
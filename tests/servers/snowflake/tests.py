@@ -3,7 +3,9 @@ import uuid
 
 DB_NAME = "TEST_DB_" + str(uuid.uuid4())[:8]
 TABLE_NAME = "TEST_TABLE_" + str(uuid.uuid4())[:8]
-WAREHOUSE_NAME = "TEST_WAREHOUSE_" + str(uuid.uuid4())[:8]
+# create_warehouse uses CREATE WAREHOUSE IF NOT EXISTS, so every run reuses
+# one warehouse instead of leaving a new one behind each time
+WAREHOUSE_NAME = "TEST_WAREHOUSE_GUMCP"
 SCHEMA_NAME = "PUBLIC"
 
 
@@ -30,16 +30,6 @@ if __name__ == "__main__":
         print(f"Error: No tests.py found for server '{server_name}'")
         sys.exit(1)
 
-    # Clean up any existing .pyc files and __pycache__ directories
-    for root, dirs, files in os.walk(os.path.dirname(tests_path)):
-        if "__pycache__" in dirs:
-            import shutil
-
-            shutil.rmtree(os.path.join(root, "__pycache__"))
-        for file in files:
-            if file.endswith(".pyc"):
-                os.remove(os.path.join(root, file))
-
     # Construct pytest arguments
     pytest_args = [
         "-v",  # verbose output
@@ -1,6 +1,7 @@
 import pytest
 import re
-import random
+
+from tests.utils.test_tools import get_test_ids, random_digits_setup
 
 TOOL_TESTS = [
     # Basic information tools
@@ -136,7 +137,7 @@ TOOL_TESTS = [
         },
         "description": "create a new collection for a site and return new new_collection_id",
         "depends_on": ["site_id"],
-        "setup": lambda context: {"random_id": str(random.randint(10000, 99999))},
+        "setup": random_digits_setup,
     },
     # Collection items staging tests
     {
@@ -146,7 +147,7 @@ TOOL_TESTS = [
         "regex_extractors": {"new_item_id": r"new_item_id\s*:\s*([^\s]+)"},
         "description": "create a new item in a collection and return id as new_item_id",
         "depends_on": ["new_collection_id"],
-        "setup": lambda context: {"random_id": str(random.randint(10000, 99999))},
+        "setup": random_digits_setup,
     },
     {
         "name": "list_collection_items_staging",
@@ -168,7 +169,7 @@ TOOL_TESTS = [
         "expected_keywords": ["fieldData"],
         "description": "update a specific item in a collection and return fieldData",
         "depends_on": ["new_collection_id", "new_item_id"],
-        "setup": lambda context: {"random_id": str(random.randint(10000, 99999))},
+        "setup": random_digits_setup,
     },
     # Cleanup - deleting items first, then collections
     {
@@ -222,7 +223,7 @@ TOOL_TESTS = [
         },
         "description": "invite a new user to a site",
         "depends_on": ["site_id"],
-        "setup": lambda context: {"random_id": str(random.randint(10000, 99999))},
+        "setup": random_digits_setup,
         "skip": True,
     },
     {
@@ -247,11 +248,10 @@ def context():
     return SHARED_CONTEXT
 
 
-def get_test_id(test_config):
-    return f"{test_config['name']}_{hash(test_config['description']) % 1000}"
+TOOL_TEST_IDS = get_test_ids(TOOL_TESTS)
 
 
-@pytest.mark.parametrize("test_config", TOOL_TESTS, ids=get_test_id)
+@pytest.mark.parametrize("test_config", TOOL_TESTS, ids=TOOL_TEST_IDS)
 @pytest.mark.asyncio
 async def test_webflow_tool(client, context, test_config):
     if test_config.get("skip", False):
@@ -1,7 +1,10 @@
 import pytest
-import random
-from tests.utils.test_tools import get_test_id, run_tool_test, run_resources_test
-
+from tests.utils.test_tools import (
+    get_test_ids,
+    run_tool_test,
+    run_resources_test,
+    random_digits_setup,
+)
 
 TOOL_TESTS = [
     {
@@ -20,7 +23,7 @@ TOOL_TESTS = [
             "is_sharepoint": r'"?is_sharepoint"?[:\s]+"?([^"]+)"?',
         },
         "description": "create a new Word document and return its file id as created_file_id and based on url return is_sharepoint as true or false",
-        "setup": lambda context: {"random_id": str(random.randint(10000, 99999))},
+        "setup": random_digits_setup,
     },
     {
         "name": "write_document",
@@ -70,7 +73,10 @@ def context():
     return SHARED_CONTEXT
 
 
-@pytest.mark.parametrize("test_config", TOOL_TESTS, ids=get_test_id)
+TOOL_TEST_IDS = get_test_ids(TOOL_TESTS)
+
+
+@pytest.mark.parametrize("test_config", TOOL_TESTS, ids=TOOL_TEST_IDS)
 @pytest.mark.asyncio
 async def test_word_tool(client, context, test_config):
     return await run_tool_test(client, context, test_config)
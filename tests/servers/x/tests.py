@@ -2,7 +2,6 @@ import re
 import pytest
 import uuid
 import time
-import logging
 
 
 def handle_rate_limit(response, client=None):
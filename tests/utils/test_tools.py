@@ -1,31 +1,103 @@
 import pytest
 import re
+import secrets
+import random
+import zlib
+import string
+import asyncio
 import logging
+import graphlib
+import warnings
+import functools
+import collections
+from typing import Callable, Dict, List, Required, TypedDict, Union
 
 logger = logging.getLogger(__name__)
 
 
-def get_test_id(test_config):
-    """Generate a unique test ID based on the test name and description hash"""
-    return f"{test_config['name']}_{hash(test_config['description']) % 1000}"
+class ToolTestConfig(TypedDict, total=False):
+    """Schema of a TOOL_TESTS entry (see tests/README.md)"""
 
+    name: Required[str]
+    expected_keywords: Required[List[str]]
+    description: Required[str]
+    args: str
+    args_template: str
+    regex_extractors: Dict[str, Union[str, re.Pattern]]
+    depends_on: List[str]
+    run_after: List[str]
+    setup: Callable[[dict], dict]
+    skip: bool
 
-@pytest.mark.asyncio
-async def run_tool_test(client, context: dict, test_config: dict) -> dict:
+
+@functools.lru_cache(maxsize=None)
+def compile_extractor(pattern: str) -> re.Pattern:
+    """Compile a regex_extractors pattern once with the flags used for matching"""
+    return re.compile(pattern, re.DOTALL | re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=None)
+def args_template_fields(template: str) -> tuple:
+    """Parse an args_template once and return the context keys it references"""
+    return tuple(
+        field for _, field, _, _ in string.Formatter().parse(template) if field
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _format_args_template(template: str, values: tuple) -> str:
+    return template.format_map(dict(zip(args_template_fields(template), values)))
+
+
+def render_args_template(template: str, context: dict) -> str:
+    """Render an args_template, reusing the result for the same referenced values"""
+    values = tuple(context[field] for field in args_template_fields(template))
+    try:
+        return _format_args_template(template, values)
+    except TypeError:
+        # Unhashable context value, render without the cache
+        return template.format_map(context)
+
+
+_RANDOM_ID_POOL: collections.deque[str] = collections.deque()
+
+
+def random_id_setup(context: dict) -> dict:
+    """Setup hook that gives a test a fresh 8-character random_id
+
+    Ids are taken from a pool filled 128 at a time by a single read of the
+    system RNG.
     """
-    Common test function for running tool tests across different servers.
+    if not _RANDOM_ID_POOL:
+        token = secrets.token_hex(4 * 128)
+        _RANDOM_ID_POOL.extend(token[i : i + 8] for i in range(0, len(token), 8))
+    return {"random_id": _RANDOM_ID_POOL.popleft()}
 
-    Args:
-        client: The client fixture
-        context: Module-scoped context dictionary to store test values
-        test_config: Configuration for the specific test to run
 
-    Returns:
-        Updated context dictionary with test results
+def random_digits_setup(context: dict, _randint=random.randint) -> dict:
+    """Setup hook that gives a test a fresh 5-digit numeric random_id"""
+    return {"random_id": str(_randint(10000, 99999))}
+
+
+def get_test_id(test_config: ToolTestConfig):
+    """Generate a unique test ID based on the test name and description hash"""
+    description_hash = zlib.crc32(test_config["description"].encode()) % 1000
+    return f"{test_config['name']}_{description_hash}"
+
+
+def get_test_ids(tool_tests: List[ToolTestConfig]) -> List[str]:
+    """Compute the parametrize ids for a TOOL_TESTS list once, at import time"""
+    return [get_test_id(test_config) for test_config in tool_tests]
+
+
+def _prepare_tool_test(context: dict, test_config: ToolTestConfig) -> str:
+    """Check a test's dependencies, run its setup hook and return its rendered args
+
+    Skips the calling test when the config is marked to skip or a value it
+    depends on is not in the context.
     """
     if test_config.get("skip", False):
         pytest.skip(f"Test {test_config['name']} marked to skip")
-        return
 
     missing_deps = []
     for dep in test_config.get("depends_on", []):
@@ -36,33 +108,106 @@ async def run_tool_test(client, context: dict, test_config: dict) -> dict:
 
     if missing_deps:
         pytest.skip(f"Missing dependencies: {', '.join(missing_deps)}")
-        return
 
-    if "setup" in test_config and callable(test_config["setup"]):
-        setup_result = test_config["setup"](context)
+    setup = test_config.get("setup")
+    if callable(setup):
+        setup_result = setup(context)
         if isinstance(setup_result, dict):
             context.update(setup_result)
 
+    if "args" in test_config:
+        return test_config["args"]
+    if "args_template" not in test_config:
+        return ""
+
+    try:
+        args_template = test_config["args_template"]
+        missing_values = [
+            field
+            for field in args_template_fields(args_template)
+            if field not in context
+        ]
+        if missing_values:
+            pytest.skip(f"Missing context value: {', '.join(missing_values)}")
+        return render_args_template(args_template, context)
+    except KeyError as e:
+        pytest.skip(f"Missing context value: {e}")
+    except Exception as e:
+        pytest.skip(f"Error formatting args: {e}")
+
+
+def _check_tool_test_response(
+    context: dict, test_config: ToolTestConfig, response: str
+) -> dict:
+    """Check a tool test's response for its keywords and extract its values into the context"""
     tool_name = test_config["name"]
     expected_keywords = test_config["expected_keywords"]
-    description = test_config["description"]
+    regex_extractors = test_config.get("regex_extractors", {})
 
-    if "args" in test_config:
-        args = test_config["args"]
-    elif "args_template" in test_config:
-        try:
-            args = test_config["args_template"].format(**context)
-        except KeyError as e:
-            pytest.skip(f"Missing context value: {e}")
-            return
-        except Exception as e:
-            pytest.skip(f"Error formatting args: {e}")
-            return
-    else:
-        args = ""
+    response_lower = response.lower()
+    if (
+        "empty" in response_lower
+        or "[]" in response
+        or "no items" in response_lower
+        or "not found" in response_lower
+    ):
+        for key in regex_extractors:
+            if key not in context:
+                context[key] = "empty_list"
 
-    keywords_str = ", ".join(expected_keywords)
-    prompt = prompt = (
+        pytest.skip(f"Empty result from API for {tool_name}")
+
+    if "error_message" in response_lower and "error_message" not in expected_keywords:
+        pytest.fail(f"API error for {tool_name}: {response}")
+
+    missing_keywords = []
+    for keyword in expected_keywords:
+        if keyword != "error_message" and keyword.lower() not in response_lower:
+            missing_keywords.append(keyword)
+
+    if missing_keywords:
+        pytest.skip(f"Keywords not found: {', '.join(missing_keywords)}")
+
+    for key, pattern in regex_extractors.items():
+        regex = (
+            pattern if isinstance(pattern, re.Pattern) else compile_extractor(pattern)
+        )
+        match = regex.search(response)
+        if match and len(match.groups()) > 0:
+            context[key] = match.group(1).strip()
+            # For debugging purposes
+            print(f"Extracted {key}: {context[key]}")
+        else:
+            # For debugging purposes
+            logger.info(
+                f"Failed to extract {key} using pattern: {pattern} from response: {response}"
+            )
+            pytest.fail(
+                f"Failed to extract '{key}' using pattern '{pattern}' from response: {response}"
+            )
+
+    return context
+
+
+@pytest.mark.asyncio
+async def run_tool_test(client, context: dict, test_config: ToolTestConfig) -> dict:
+    """
+    Common test function for running tool tests across different servers.
+
+    Args:
+        client: The client fixture
+        context: Module-scoped context dictionary to store test values
+        test_config: Configuration for the specific test to run
+
+    Returns:
+        Updated context dictionary with test results
+    """
+    args = _prepare_tool_test(context, test_config)
+
+    tool_name = test_config["name"]
+    description = test_config["description"]
+    keywords_str = ", ".join(test_config["expected_keywords"])
+    prompt = (
         "Execute these instructions precisely without recommendations or best practice suggestions:\n\n"
         f"1. Use the {tool_name} tool to perform {description} with the following arguments: {args}.\n"
         f"2. Only pass required arguments. For any missing required arguments, supply reasonable values.\n"
@@ -82,50 +227,250 @@ async def run_tool_test(client, context: dict, test_config: dict) -> dict:
 
     print(f"Response: {response}")
 
-    if (
-        "empty" in response.lower()
-        or "[]" in response
-        or "no items" in response.lower()
-        or "not found" in response.lower()
-    ):
-        if "regex_extractors" in test_config:
-            for key, pattern in test_config["regex_extractors"].items():
-                if key not in context:
-                    context[key] = "empty_list"
+    return _check_tool_test_response(context, test_config, response)
 
-        pytest.skip(f"Empty result from API for {tool_name}")
-        return
 
-    if "error_message" in response.lower() and "error_message" not in expected_keywords:
-        pytest.fail(f"API error for {tool_name}: {response}")
-        return
+# What a tool test can raise and still count as a recorded outcome
+_TEST_OUTCOMES = (Exception, pytest.skip.Exception, pytest.fail.Exception)
 
-    missing_keywords = []
-    for keyword in expected_keywords:
-        if keyword != "error_message" and keyword.lower() not in response.lower():
-            missing_keywords.append(keyword)
 
-    if missing_keywords:
-        pytest.skip(f"Keywords not found: {', '.join(missing_keywords)}")
-        return
-
-    if "regex_extractors" in test_config:
-        for key, pattern in test_config["regex_extractors"].items():
-            match = re.search(pattern, response, re.DOTALL | re.IGNORECASE)
-            if match and len(match.groups()) > 0:
-                context[key] = match.group(1).strip()
-                # For debugging purposes
-                print(f"Extracted {key}: {context[key]}")
-            else:
-                # For debugging purposes
-                logger.info(
-                    f"Failed to extract {key} using pattern: {pattern} from response: {response}"
-                )
-                pytest.fail(
-                    f"Failed to extract '{key}' using pattern '{pattern}' from response: {response}"
-                )
+def index_tool_tests(
+    tool_tests: List[ToolTestConfig],
+) -> tuple[dict[str, list[int]], dict[str, list[int]]]:
+    """
+    Index a TOOL_TESTS list by test name and by the context keys each test produces.
 
-    return context
+    Args:
+        tool_tests: List of test configurations
+
+    Returns:
+        Tuple of (by_name, producers): by_name maps a tool name to the indexes
+        of its tests, producers maps a context key to the indexes of the tests
+        whose regex_extractors extract it
+    """
+    by_name: dict[str, list[int]] = {}
+    producers: dict[str, list[int]] = {}
+    for index, test_config in enumerate(tool_tests):
+        by_name.setdefault(test_config["name"], []).append(index)
+        for key in test_config.get("regex_extractors", {}):
+            producers.setdefault(key, []).append(index)
+    return by_name, producers
+
+
+def _tool_test_graph(tool_tests: List[ToolTestConfig]) -> dict:
+    """Map each test's index to the indexes of the tests it has to wait for
+
+    A test waits for the tests whose regex_extractors produce a key in its
+    depends_on, and for the tests named in its optional run_after list.
+    """
+    names, producers = index_tool_tests(tool_tests)
+
+    graph = {}
+    for index, test_config in enumerate(tool_tests):
+        predecessors = set()
+        for dep in test_config.get("depends_on", []):
+            predecessors.update(producers.get(dep, []))
+        for name in test_config.get("run_after", []):
+            predecessors.update(names.get(name, []))
+        predecessors.discard(index)
+        graph[index] = predecessors
+    return graph
+
+
+def count_tool_test_layers(tool_tests: List[ToolTestConfig]) -> int:
+    """
+    Count the dependency layers run_tool_tests_concurrently runs one after another.
+
+    Meant for sizing a driver test's timeout, e.g.
+    @pytest.mark.timeout(120 * count_tool_test_layers(TOOL_TESTS)).
+
+    Args:
+        tool_tests: List of test configurations
+
+    Returns:
+        Number of layers, or the number of tests if the declarations contain
+        a cycle (they then run one by one)
+    """
+    sorter = graphlib.TopologicalSorter(_tool_test_graph(tool_tests))
+    try:
+        sorter.prepare()
+    except graphlib.CycleError:
+        return len(tool_tests)
+    layers = 0
+    while sorter.is_active():
+        ready = sorter.get_ready()
+        sorter.done(*ready)
+        layers += 1
+    return layers
+
+
+async def run_tool_tests_concurrently(
+    client, context: dict, tool_tests: List[ToolTestConfig]
+) -> dict:
+    """
+    Run a list of tool tests in dependency order, running independent tests concurrently.
+
+    Tests are grouped into layers from their depends_on / run_after
+    declarations and every layer is awaited with asyncio.gather, so tests
+    that don't depend on each other share one round-trip of wall-clock time.
+    Tests in a layer don't see each other's context writes until the whole
+    layer has finished.
+    Falls back to running the tests one by one in list order if the
+    declarations contain a cycle.
+
+    Args:
+        client: The client fixture
+        context: Module-scoped context dictionary to store test values
+        tool_tests: List of test configurations, as passed to run_tool_test
+
+    Returns:
+        Dict mapping each test's id (see get_test_id, so tests sharing a tool
+        name stay apart) to its outcome: the updated context, or the skip /
+        failure exception raised by run_tool_test
+
+    Any failure fails the calling test with every failure message. Skipped
+    tests are reported in a warning, and the calling test is skipped if
+    every tool test skipped.
+    """
+    outcomes: Dict[str, Union[dict, BaseException]] = {}
+    test_ids = get_test_ids(tool_tests)
+
+    async def run_single(index, scope):
+        try:
+            await run_tool_test(client, scope, tool_tests[index])
+            result = context
+        except _TEST_OUTCOMES as e:
+            result = e
+        outcomes[test_ids[index]] = result
+
+    async def run_layer(indexes):
+        # Every test in the layer writes to its own scope over the shared
+        # context, so siblings never see each other's setup values. The
+        # scopes are merged back in list order once the layer is done.
+        scopes = [collections.ChainMap({}, context) for _ in indexes]
+        await asyncio.gather(
+            *(run_single(index, scope) for index, scope in zip(indexes, scopes))
+        )
+        for scope in scopes:
+            context.update(scope.maps[0])
+
+    sorter = graphlib.TopologicalSorter(_tool_test_graph(tool_tests))
+    try:
+        sorter.prepare()
+    except graphlib.CycleError as e:
+        logger.warning(f"Dependency cycle in tool tests, running serially: {e}")
+        for index in range(len(tool_tests)):
+            await run_layer([index])
+    else:
+        while sorter.is_active():
+            ready = sorted(sorter.get_ready())
+            await run_layer(ready)
+            sorter.done(*ready)
+
+    failures = [
+        f"{name}: {result}"
+        for name, result in outcomes.items()
+        if isinstance(result, BaseException)
+        and not isinstance(result, pytest.skip.Exception)
+    ]
+    if failures:
+        pytest.fail("Tool tests failed:\n" + "\n".join(failures))
+
+    skipped = [
+        f"{name}: {result}"
+        for name, result in outcomes.items()
+        if isinstance(result, pytest.skip.Exception)
+    ]
+    if skipped and len(skipped) == len(outcomes):
+        pytest.skip("All tool tests skipped:\n" + "\n".join(skipped))
+    if skipped:
+        warnings.warn(
+            f"{len(skipped)} of {len(outcomes)} tool tests skipped:\n"
+            + "\n".join(skipped)
+        )
+
+    return outcomes
+
+
+async def _process_query_with_retry(
+    client, query: str, retries: int, backoff: float
+) -> str:
+    """Send a query, retrying with exponential back-off if it raises"""
+    for attempt in range(retries):
+        try:
+            return await client.process_query(query)
+        except Exception as e:
+            delay = backoff * 2**attempt
+            logger.warning(f"Query failed ({e!r}), retrying in {delay}s")
+            await asyncio.sleep(delay)
+    return await client.process_query(query)
+
+
+async def run_queries_concurrently(
+    client, queries: Dict[str, str], retries: int = 2, backoff: float = 0.5
+) -> dict:
+    """
+    Send independent queries at the same time and collect their responses.
+
+    A query that raises is retried on its own, so one transient failure
+    neither fails nor re-sends the rest of the batch. Only meant for
+    read-only queries, since a retried query may have reached the server.
+
+    Args:
+        client: The client fixture
+        queries: Dict mapping a name to the query to send
+        retries: How many times to retry a query that raised
+        backoff: Delay in seconds before the first retry, doubled for each
+            further retry
+
+    Returns:
+        Dict mapping each name to its response, or to the exception its
+        last attempt raised (see query_response)
+    """
+    responses = await asyncio.gather(
+        *(
+            _process_query_with_retry(client, query, retries, backoff)
+            for query in queries.values()
+        ),
+        return_exceptions=True,
+    )
+    return dict(zip(queries, responses))
+
+
+def query_response(responses: dict, name: str) -> str:
+    """Return a response gathered with return_exceptions, re-raising its error"""
+    response = responses[name]
+    if isinstance(response, BaseException):
+        raise response
+    return response
+
+
+@functools.lru_cache(maxsize=None)
+def _phrases_re(phrases: tuple) -> re.Pattern:
+    return re.compile("|".join(map(re.escape, phrases)), re.IGNORECASE)
+
+
+def contains_ci(response: str, *phrases: str) -> bool:
+    """Case-insensitive check for any of the phrases in one pass, without copying the response"""
+    return _phrases_re(phrases).search(response) is not None
+
+
+def check_response(response: str, phrase: str, label: str) -> None:
+    """
+    Assert that a response contains a phrase, ignoring case.
+
+    The response is logged at debug level (shown with --log-level=DEBUG)
+    instead of printed, so passing tests add nothing to the captured output.
+
+    Args:
+        response: Response returned by process_query
+        phrase: Phrase the response must contain
+        label: Name of the check, used in the failure and log messages
+    """
+    assert contains_ci(
+        response, phrase
+    ), f"{label}: expected {phrase!r} in response: {response}"
+    logger.debug(f"{label} response:\n\t{response}")
 
 
 @pytest.mark.asyncio
@@ -156,3 +501,50 @@ async def run_resources_test(client):
     assert contents.contents, f"No content returned for {resource.uri}"
 
     return response
+
+
+def find_first_resources(resources, prefixes: Dict[str, str]) -> dict:
+    """
+    Find the first listed resource of each kind in one pass over a listing.
+
+    Args:
+        resources: list_resources response, e.g. the resources fixture
+        prefixes: Dict mapping each kind to the URI prefix of its resources
+
+    Returns:
+        Dict mapping each kind to its first resource, or to None if the
+        server listed no resource of that kind
+    """
+    first = dict.fromkeys(prefixes)
+    for resource in resources.resources:
+        uri = str(resource.uri)
+        kind = next(
+            (kind for kind, prefix in prefixes.items() if uri.startswith(prefix)),
+            None,
+        )
+        if kind is not None and first[kind] is None:
+            first[kind] = resource
+            if all(first.values()):
+                break
+    return first
+
+
+async def read_first_resources(client, first_resources: dict) -> dict:
+    """
+    Read the resources found by find_first_resources concurrently.
+
+    Args:
+        client: The client fixture
+        first_resources: Dict mapping each kind to a resource or None
+
+    Returns:
+        Dict mapping each kind to its read_resource response, to the error
+        reading it raised (see query_response), or to None if there was no
+        resource of that kind
+    """
+    found = [kind for kind, resource in first_resources.items() if resource]
+    contents = await asyncio.gather(
+        *(client.read_resource(first_resources[kind].uri) for kind in found),
+        return_exceptions=True,
+    )
+    return dict.fromkeys(first_resources) | dict(zip(found, contents))